@@ -8,16 +8,68 @@ import sqlite3
 import json
 import random
 from datetime import datetime, timedelta
-from faker import Faker
-
-fake = Faker()
 
 # Database connection
 DB_PATH = "skillnavigator.db"
 
-def add_mock_applications():
-    """Add realistic application data for dashboard"""
+INSERT_SQL = """
+    INSERT INTO job_applications 
+    (user_id, job_id, applied_at, status, cover_letter, notes, auto_applied, 
+     application_method, last_updated, follow_up_date, interview_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Text templates, formatted per application
+COVER_LETTER_TMPL = """Dear {company} Hiring Team,
+
+I am excited to apply for the {title} position at {company}. With my background in software development and passion for technology, I believe I would be a valuable addition to your team.
+
+My experience with modern development frameworks and collaborative work environments aligns well with your requirements. I am particularly drawn to {company}'s innovative approach and would love to contribute to your continued success.
+
+I have attached my resume and would welcome the opportunity to discuss how my skills can benefit your team.
+
+Best regards,
+Alex Johnson"""
+
+NOTE_TEMPLATES = (
+    "Applied through company website. Really excited about {company}!",
+    "Found this role through LinkedIn. Great match for my skills.",
+    "Referred by a friend who works at {company}.",
+    "Company culture looks amazing. Perfect remote setup.",
+    "Competitive salary and benefits package.",
+    "Love the tech stack they're using.",
+    "Growth opportunities look excellent here.",
+)
+
+MAX_APPLICATIONS = 35
+BOOLS = (True, False)
+APPLICATION_METHODS = ('form', 'email', 'api')
+
+def gen_offsets(n, rng):
+    """Draw every random date offset for n applications in one pass from rng.
+    
+    Returns (applied_seconds, interview_days, interview_lead_days,
+    decision_days, follow_up_days), each a list of length n.
+    """
+    _randrange = rng.randrange
+    idx = range(n)
+    return (
+        [_randrange(60 * 86400) for _ in idx],
+        [_randrange(5, 16) for _ in idx],
+        [_randrange(1, 4) for _ in idx],
+        [_randrange(7, 26) for _ in idx],
+        [_randrange(7, 15) for _ in idx],
+    )
+
+def add_mock_applications(seed=None):
+    """Add realistic application data for dashboard (pass seed for reproducible data)"""
+    rng = random.Random(seed)
     conn = sqlite3.connect(DB_PATH)
+    # Skip per-commit fsyncs and rollback-journal churn; this is throwaway demo data
+    conn.executescript(
+        "PRAGMA journal_mode=WAL; PRAGMA synchronous=OFF; "
+        "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-65536;"
+    )
     cursor = conn.cursor()
     
     print("📊 Adding mock application data for dashboard...")
@@ -27,21 +79,21 @@ def add_mock_applications():
     result = cursor.fetchone()
     if not result:
         print("❌ No user found in database!")
+        conn.close()
         return
     
     user_id = result[0]
     
-    # Get some job IDs to apply to
-    cursor.execute("SELECT id, title, company FROM jobs ORDER BY RANDOM() LIMIT 35")
-    jobs = cursor.fetchall()
+    # Get some job IDs to apply to (sampled in Python; ORDER BY RANDOM() sorts the whole table)
+    cursor.execute("SELECT id, title, company FROM jobs")
+    all_jobs = cursor.fetchall()
+    jobs = rng.sample(all_jobs, min(MAX_APPLICATIONS, len(all_jobs)))
     
     if not jobs:
         print("❌ No jobs found in database!")
+        conn.close()
         return
     
-    # Delete existing applications first
-    cursor.execute("DELETE FROM job_applications WHERE user_id = ?", (user_id,))
-    
     application_statuses = {
         'applied': 15,      # 15 applications still pending
         'interview': 6,     # 6 interviews scheduled
@@ -50,73 +102,68 @@ def add_mock_applications():
         'pending': 4        # 4 pending reviews
     }
     
-    applications_created = 0
+    rows = []
     
-    for status, count in application_statuses.items():
-        for i in range(count):
-            if applications_created >= len(jobs):
-                break
-                
-            job_id, job_title, company = jobs[applications_created]
-            
-            # Create realistic application dates (last 60 days)
-            applied_date = fake.date_time_between(start_date='-60d', end_date='now')
-            
-            # Set interview/follow-up dates based on status
-            interview_date = None
-            follow_up_date = None
-            last_updated = applied_date
-            
-            if status == 'interview':
-                interview_date = applied_date + timedelta(days=random.randint(5, 15))
-                last_updated = interview_date - timedelta(days=random.randint(1, 3))
-            elif status in ['rejected', 'accepted']:
-                last_updated = applied_date + timedelta(days=random.randint(7, 25))
-            elif status == 'pending':
-                follow_up_date = applied_date + timedelta(days=random.randint(7, 14))
-            
-            # Create cover letter
-            cover_letter = f"""Dear {company} Hiring Team,
-
-I am excited to apply for the {job_title} position at {company}. With my background in software development and passion for technology, I believe I would be a valuable addition to your team.
-
-My experience with modern development frameworks and collaborative work environments aligns well with your requirements. I am particularly drawn to {company}'s innovative approach and would love to contribute to your continued success.
-
-I have attached my resume and would welcome the opportunity to discuss how my skills can benefit your team.
-
-Best regards,
-Alex Johnson"""
-            
-            notes = random.choice([
-                f"Applied through company website. Really excited about {company}!",
-                f"Found this role through LinkedIn. Great match for my skills.",
-                f"Referred by a friend who works at {company}.",
-                f"Company culture looks amazing. Perfect remote setup.",
-                f"Competitive salary and benefits package.",
-                f"Love the tech stack they're using.",
-                f"Growth opportunities look excellent here."
-            ])
-            
-            cursor.execute("""
-                INSERT INTO job_applications 
-                (user_id, job_id, applied_at, status, cover_letter, notes, auto_applied, 
-                 application_method, last_updated, follow_up_date, interview_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                user_id, job_id, applied_date.isoformat(), status, cover_letter, notes,
-                random.choice([True, False]), random.choice(['form', 'email', 'api']),
-                last_updated.isoformat(),
-                follow_up_date.isoformat() if follow_up_date else None,
-                interview_date.isoformat() if interview_date else None
-            ))
-            
-            applications_created += 1
+    # Bind hot-loop helpers to locals to skip repeated global/attribute lookups
+    _choice = rng.choice
+    _td = timedelta
+    
+    # Draw every date offset up front, relative to a single "now"
+    base_now = datetime.now()
+    (applied_offsets, interview_days, interview_lead_days,
+     decision_days, follow_up_days) = gen_offsets(len(jobs), rng)
+    
+    # Build all text up front so the loop below only assembles rows
+    cover_letters = [
+        COVER_LETTER_TMPL.format(company=company, title=job_title)
+        for _, job_title, company in jobs
+    ]
+    notes_list = [_choice(NOTE_TEMPLATES).format(company=company) for _, _, company in jobs]
+    
+    # One status per sampled job, in the order the statuses are listed
+    statuses = [s for s, c in application_statuses.items() for _ in range(c)][:len(jobs)]
+    
+    for i, status in enumerate(statuses):
+        job_id = jobs[i][0]
+        
+        # Create realistic application dates (last 60 days)
+        applied_date = base_now - _td(seconds=applied_offsets[i])
+        
+        # Set interview/follow-up dates based on status
+        interview_date = None
+        follow_up_date = None
+        last_updated = applied_date
+        
+        if status == 'interview':
+            interview_date = applied_date + _td(days=interview_days[i])
+            last_updated = interview_date - _td(days=interview_lead_days[i])
+        elif status in ['rejected', 'accepted']:
+            last_updated = applied_date + _td(days=decision_days[i])
+        elif status == 'pending':
+            follow_up_date = applied_date + _td(days=follow_up_days[i])
+        
+        applied_iso = applied_date.isoformat(timespec="seconds")
+        last_updated_iso = last_updated.isoformat(timespec="seconds")
+        follow_up_iso = follow_up_date.isoformat(timespec="seconds") if follow_up_date else None
+        interview_iso = interview_date.isoformat(timespec="seconds") if interview_date else None
+        
+        rows.append((
+            user_id, job_id, applied_iso, status,
+            cover_letters[i], notes_list[i],
+            _choice(BOOLS), _choice(APPLICATION_METHODS),
+            last_updated_iso, follow_up_iso, interview_iso
+        ))
     
-    conn.commit()
+    # Replace the user's existing applications in a single transaction; the
+    # default (deferred) isolation level makes this emit one BEGIN/COMMIT pair
+    with conn:
+        cursor.execute("DELETE FROM job_applications WHERE user_id = ?", (user_id,))
+        cursor.executemany(INSERT_SQL, rows)
     conn.close()
     
-    print(f"✅ Added {applications_created} mock applications!")
+    print(f"✅ Added {len(rows)} mock applications!")
     print(f"📊 Dashboard will now show:")
+    total = sum(application_statuses.values())
     for status, count in application_statuses.items():
         if status == 'applied':
             print(f"   • {count} Total Applications")
@@ -125,7 +172,7 @@ Alex Johnson"""
         elif status == 'interview':
             print(f"   • {count} Interviews Scheduled")
         elif status == 'accepted':
-            success_rate = round((count / sum(application_statuses.values())) * 100, 1)
+            success_rate = round((count / total) * 100, 1)
             print(f"   • {success_rate}% Success Rate ({count} offers)")
 
 if __name__ == "__main__":
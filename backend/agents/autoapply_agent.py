@@ -6,11 +6,21 @@ Automatically fills out job applications and generates personalized cover letter
 import asyncio
 import logging
 import os
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+import re
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import MappingProxyType, SimpleNamespace
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+from email.mime.application import MIMEApplication
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+import hashlib
 import json
-import requests
 import time
+import aiofiles
+import aiohttp
 
 # Optional Playwright imports for future use
 try:
@@ -20,22 +30,159 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     Page = Browser = None
 
+# Optional SMTP client, only needed for email applications
+try:
+    import aiosmtplib
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+    aiosmtplib = None
+
 from database.db_connection import database
 from utils.prompt_templates import CoverLetterGenerator
-from utils.scraper_helpers import wait_random_delay
+from utils.scraper_helpers import TokenBucket, wait_random_delay
 
 logger = logging.getLogger(__name__)
 
+# How long the database count of today's applications is trusted before re-querying
+APPLICATIONS_TODAY_TTL = 30  # seconds
+
+# Maximum number of generated cover letters kept for reuse
+COVER_LETTER_CACHE_SIZE = 256
+
+# Maximum number of distinct form layouts whose resolved fillers are kept
+FORM_FILLER_CACHE_SIZE = 64
+
+# Per-host application throttle: one application every 45 seconds, bursts of 2
+APPLY_RATE_PER_HOST = 1 / 45.0
+APPLY_BURST_PER_HOST = 2
+
+# Application methods whose handlers actually use a cover letter
+NEEDS_COVER_LETTER = frozenset({'linkedin', 'indeed', 'form', 'email'})
+
+# Application methods that can only report "apply manually"; they never
+# touch the page or the cover letter, so _apply_to_job returns them early
+SHORT_CIRCUIT_METHODS = frozenset({'manual', 'http_linkedin', 'http_indeed'})
+
+# Zero-argument coroutine factory handed to application handlers; the cover
+# letter is only generated if a handler actually awaits it
+CoverLetterFactory = Callable[[], Awaitable[str]]
+
+# Job portals recognised from the apply URL host (subdomains match too)
+HOST_HANDLERS = {
+    'linkedin.com': 'linkedin',
+    'indeed.com': 'indeed',
+    'internshala.com': 'internshala',
+}
+
+
+def _portal_for_host(host: str) -> Optional[str]:
+    """Map an apply URL host to a known job portal, trying parent domains too"""
+    labels = host.lower().split('.')
+    for i in range(len(labels) - 1):
+        portal = HOST_HANDLERS.get('.'.join(labels[i:]))
+        if portal:
+            return portal
+    return None
+
+
+# Email application templates
+EMAIL_SUBJECT_TEMPLATE = "Application for {title} at {company}"
+RESUME_FILENAME_TEMPLATE = "{name}_resume.pdf"
+
+# Form selectors, built once at import: (selector, profile field) pairs per form
+RESUME_UPLOAD_SELECTOR = 'input[type="file"]'
+
+LINKEDIN_FIELDS = (
+    ('input[name="name"]', 'name'),
+    ('input[name="email"]', 'email'),
+    ('input[name="phone"]', 'phone'),
+    ('textarea', 'cover_letter'),
+)
+LINKEDIN_SUBMIT_SELECTOR = 'button[type="submit"]'
+
+INDEED_FIELDS = (
+    ('input[name*="name"]', 'name'),
+    ('input[name*="email"]', 'email'),
+    ('input[name*="phone"]', 'phone'),
+    ('textarea[name*="cover"]', 'cover_letter'),
+    ('textarea[name*="message"]', 'cover_letter'),
+)
+INDEED_SUBMIT_SELECTOR = 'button[type="submit"], input[type="submit"]'
+
+# Generic forms: candidate selectors per field, first match wins
+FIELD_PATTERNS = (
+    ('name', ('input[name*="name"]', 'input[id*="name"]')),
+    ('email', ('input[name*="email"]', 'input[id*="email"]')),
+    ('phone', ('input[name*="phone"]', 'input[id*="phone"]')),
+    ('cover_letter', ('textarea[name*="cover"]', 'textarea[name*="message"]', 'textarea')),
+)
+SUBMIT_SELECTORS = (
+    'button[type="submit"]',
+    'input[type="submit"]',
+    'button:has-text("Submit")',
+    'button:has-text("Apply")',
+)
+
+# Selector syntax only Playwright's engine understands; everything else is
+# plain CSS and can be resolved in the page with document.querySelector
+PLAYWRIGHT_SELECTOR_RE = re.compile(r':has-text\(|:text\(|:visible|>>')
+
+# Resolves a batch of CSS selectors to their first matches in one round trip
+QUERY_SELECTORS_JS = "selectors => selectors.map(sel => document.querySelector(sel))"
+
+# Describes a page's form controls; pages built by the same ATS give the same string
+FORM_SIGNATURE_JS = """() => Array.from(
+    document.querySelectorAll('input, textarea, select, button'),
+    el => [el.tagName, el.type, el.name, el.id, el.tagName === 'BUTTON' ? el.textContent.trim() : ''].join(':')
+).join('|')"""
+
 
 class AutoApplyAgent:
     """Autonomous agent for automatically applying to jobs"""
     
     def __init__(self):
         self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
         self.cover_letter_generator = CoverLetterGenerator()
         self.applications_today = 0
+        self._applications_today_checked: Optional[float] = None
         self.max_applications_per_day = int(os.getenv("MAX_APPLICATIONS_PER_DAY", 10))
+        self.concurrency = int(os.getenv("AUTOAPPLY_CONCURRENCY", 5))
+        
+        # Browser contexts shared by concurrent applications, one per worker;
+        # filled by _init_playwright
+        self._context_pool: Optional[asyncio.Queue] = None
+        
+        # Email configuration, read from the environment once
+        self._email_cfg = SimpleNamespace(
+            host=os.getenv("EMAIL_HOST", "smtp.gmail.com"),
+            port=int(os.getenv("EMAIL_PORT", 587)),
+            user=os.getenv("EMAIL_USERNAME"),
+            password=os.getenv("EMAIL_PASSWORD")
+        )
+        
+        # Concurrency bookkeeping: reserved slots count against the daily limit
+        # while in flight, and each host is worked on one job at a time and
+        # throttled by its own token bucket
+        self._applications_in_flight = 0
+        self._limit_lock = asyncio.Lock()
+        self._host_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._rate_limiters: Dict[str, TokenBucket] = defaultdict(
+            lambda: TokenBucket(rate=APPLY_RATE_PER_HOST, capacity=APPLY_BURST_PER_HOST)
+        )
+        
+        # Persistent SMTP connection, opened on first email and reused after that
+        self._smtp = None
+        self._smtp_lock = asyncio.Lock()
+        
+        # Generated cover letters (LRU) keyed by (user_id, company, title, description digest)
+        self._cover_letter_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+        
+        # Encoded resume attachments keyed by (path, mtime, size, filename)
+        self._resume_cache: Dict[Tuple[str, float, int, str], MIMEApplication] = {}
+        
+        # Generic form fillers specialised per form layout, keyed by form signature
+        self._ats_fillers: Dict[str, Callable[[Page, Dict, str], Awaitable[None]]] = {}
         
         # Application methods
         self.application_handlers = {
@@ -44,7 +191,9 @@ class AutoApplyAgent:
             'internshala': self._apply_internshala,
             'email': self._apply_via_email,
             'form': self._apply_via_form,
-            'http_form': self._apply_http_form
+            'http_form': self._apply_http_form,
+            'http_linkedin': self._apply_http_linkedin,
+            'http_indeed': self._apply_http_indeed
         }
     
     async def initialize(self):
@@ -53,15 +202,25 @@ class AutoApplyAgent:
             # For Windows compatibility, use a simple HTTP-based approach
             import platform
             
-            # Create an HTTP session for making requests
-            self.session = requests.Session()
-            self.session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
+            # Create one pooled, non-blocking HTTP session shared by all applications,
+            # kept open across repeated initialize() calls
+            if not getattr(self, 'session', None) or self.session.closed:
+                self.session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=50, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=60
+                    ),
+                    headers={
+                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+                    },
+                    timeout=aiohttp.ClientTimeout(total=30)
+                )
             self.browser = "http_session"  # Mark as using HTTP session
             
             await self.cover_letter_generator.initialize()
             
+            if not self.email_configured:
+                logger.warning("Email credentials not configured - email applications will be skipped")
+            
             # Get today's application count
             self.applications_today = await self._get_applications_today()
             
@@ -72,6 +231,11 @@ class AutoApplyAgent:
             # Don't raise the exception, allow graceful degradation
             self.browser = None
     
+    @property
+    def email_configured(self) -> bool:
+        """Whether SMTP credentials are available for email applications"""
+        return bool(self._email_cfg.user and self._email_cfg.password)
+    
     async def _init_playwright(self):
         """Initialize Playwright browser"""
         try:
@@ -80,6 +244,12 @@ class AutoApplyAgent:
                 headless=True,
                 args=['--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu', '--disable-web-security']
             )
+            
+            # Pre-warm one context per concurrent application; each keeps its
+            # cookies and HTTP cache across the jobs it serves
+            self._context_pool = asyncio.Queue()
+            for _ in range(self.concurrency):
+                self._context_pool.put_nowait(await self.browser.new_context())
         except NotImplementedError as e:
             logger.error(f"Playwright subprocess creation failed (likely Windows compatibility issue): {e}")
             logger.warning("Auto-apply functionality will be disabled")
@@ -91,10 +261,18 @@ class AutoApplyAgent:
     async def cleanup(self):
         """Clean up resources"""
         if hasattr(self, 'session') and self.session:
-            # For requests.Session, just close it (non-async)
-            self.session.close()
-        if self.page and PLAYWRIGHT_AVAILABLE:
-            await self.page.close()
+            await self.session.close()
+            self.session = None
+        if self._smtp:
+            try:
+                await self._smtp.quit()
+            except Exception as e:
+                logger.warning(f"Error closing SMTP connection: {e}")
+            self._smtp = None
+        if self._context_pool and PLAYWRIGHT_AVAILABLE:
+            while not self._context_pool.empty():
+                await self._context_pool.get_nowait().close()
+            self._context_pool = None
         if self.browser and self.browser != "http_session" and PLAYWRIGHT_AVAILABLE:
             await self.browser.close()
     
@@ -117,11 +295,12 @@ class AutoApplyAgent:
             return [{"job_id": job_id, "success": False, "status": "failed", "reason": "Auto-apply not available"} for job_id in job_ids]
         
         # Check daily limit
+        self.applications_today = await self._get_applications_today()
         if self.applications_today >= self.max_applications_per_day:
             logger.warning(f"Daily application limit reached ({self.max_applications_per_day})")
             return results
         
-        # Get user profile
+        # Get user profile, read once for this call and passed down to every application
         user_profile = await self._get_user_profile(user_id)
         if not user_profile:
             raise ValueError(f"User profile not found for user_id: {user_id}")
@@ -135,116 +314,220 @@ class AutoApplyAgent:
             metadata={"user_id": user_id, "job_count": len(job_ids)}
         )
         
-        for job_id in job_ids:
-            try:
-                # Check daily limit
-                if self.applications_today >= self.max_applications_per_day:
-                    logger.info("Daily application limit reached, stopping")
-                    break
-                
-                # Get job details
-                job = await self._get_job_details(job_id)
-                if not job:
-                    logger.warning(f"Job {job_id} not found")
-                    continue
-                
-                # Check if already applied
-                existing_application = await self._check_existing_application(user_id, job_id)
-                if existing_application:
-                    logger.info(f"Already applied to job {job_id}")
-                    continue
-                
-                # Apply to the job
-                application_result = await self._apply_to_job(user_profile, job)
-                results.append(application_result)
-                
-                # Record application in database
-                if application_result['success']:
-                    await self._record_application(user_id, job_id, application_result)
-                    self.applications_today += 1
-                
-                # Delay between applications
-                await wait_random_delay(30, 60)  # 30-60 seconds
-                
-            except Exception as e:
-                logger.error(f"Error applying to job {job_id}: {e}")
+        # Look up all jobs and prior applications up front instead of per job
+        jobs = await self._get_jobs_details(job_ids)
+        already_applied = await self._get_existing_applications(user_id, job_ids)
+        
+        # Write the cover letters the batch will need in one go
+        await self._prefetch_cover_letters(user_profile, [
+            job for job_id, job in jobs.items()
+            if job_id not in already_applied
+            and self._needs_cover_letter(self._determine_application_method(job))
+        ])
+        
+        # Apply to all jobs concurrently; per-host locks keep each site throttled
+        semaphore = asyncio.Semaphore(self.concurrency)
+        records: List[Dict] = []
+        outcomes = await asyncio.gather(
+            *(self._apply_one(user_id, user_profile, job_id, jobs.get(job_id),
+                              job_id in already_applied, semaphore, records)
+              for job_id in job_ids),
+            return_exceptions=True
+        )
+        
+        # Record successful applications in database
+        await self._record_applications(records)
+        
+        for job_id, outcome in zip(job_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error applying to job {job_id}: {outcome}")
                 results.append({
                     'job_id': job_id,
                     'success': False,
-                    'error': str(e),
+                    'error': str(outcome),
                     'method': 'unknown'
                 })
+            elif outcome is not None:
+                results.append(outcome)
+        
+        successful = sum(1 for r in results if r['success'])
         
         await database.log_system_activity(
             agent_name="autoapply_agent",
             action="auto_apply_complete",
-            message=f"Completed auto-apply: {len([r for r in results if r['success']])} successful applications",
+            message=f"Completed auto-apply: {successful} successful applications",
             metadata={
                 "user_id": user_id,
                 "total_jobs": len(job_ids),
-                "successful_applications": len([r for r in results if r['success']]),
-                "failed_applications": len([r for r in results if not r['success']])
+                "successful_applications": successful,
+                "failed_applications": len(results) - successful
             }
         )
         
         return results
     
+    async def _apply_one(self, user_id: int, user_profile: Dict, job_id: int, job,
+                         already_applied: bool, semaphore: asyncio.Semaphore,
+                         records: List[Dict]) -> Optional[Dict]:
+        """Apply to a single job of a batch; returns None when the job is skipped"""
+        if not job:
+            logger.warning(f"Job {job_id} not found")
+            return None
+        
+        if already_applied:
+            logger.info(f"Already applied to job {job_id}")
+            return None
+        
+        host = urlsplit(getattr(job, 'apply_url', '') or '').hostname or ''
+        async with self._host_locks[host]:
+            # Reserve a slot under the daily limit before doing any work
+            async with self._limit_lock:
+                if self.applications_today + self._applications_in_flight >= self.max_applications_per_day:
+                    logger.info(f"Daily application limit reached, skipping job {job_id}")
+                    return None
+                self._applications_in_flight += 1
+            
+            try:
+                # Throttle per host; manual-only outcomes never reach the site
+                if self._determine_application_method(job) not in SHORT_CIRCUIT_METHODS:
+                    await self._rate_limiters[host].acquire()
+                
+                async with semaphore:
+                    # Apply to the job
+                    application_result = await self._apply_to_job(user_profile, job)
+                    
+                    # Queue the application to be recorded with the rest of the batch
+                    if application_result['success']:
+                        records.append(self._build_application_record(user_id, job_id, application_result))
+                        self.applications_today += 1
+            finally:
+                self._applications_in_flight -= 1
+        
+        return application_result
+    
     async def _apply_to_job(self, user_profile: Dict, job) -> Dict:
         """Apply to a single job using the appropriate method"""
         
         # Determine application method
         application_method = self._determine_application_method(job)
         
-        # Generate cover letter
-        cover_letter = await self.cover_letter_generator.generate_cover_letter(
-            user_profile, job
-        )
+        # Manual-only outcomes return straight away, before any cover-letter work
+        if (application_method in SHORT_CIRCUIT_METHODS
+                or application_method not in self.application_handlers):
+            handler = self.application_handlers.get(application_method, self._apply_generic)
+            return await handler(user_profile, job, None)
+        
+        # Generate the cover letter only when a handler asks for it
+        cover_letter = None
+        
+        async def get_cover_letter() -> str:
+            nonlocal cover_letter
+            if cover_letter is None:
+                cover_letter = await self._get_cover_letter(user_profile, job)
+            return cover_letter
         
         try:
             # Apply using the determined method
-            if application_method in self.application_handlers:
-                result = await self.application_handlers[application_method](
-                    user_profile, job, cover_letter
-                )
-            else:
-                result = await self._apply_generic(user_profile, job, cover_letter)
+            result = await self.application_handlers[application_method](
+                user_profile, job, get_cover_letter
+            )
             
-            result['cover_letter'] = cover_letter
+            if cover_letter is not None:
+                result['cover_letter'] = cover_letter
             return result
             
         except Exception as e:
             logger.error(f"Error in application method {application_method}: {e}")
-            return {
+            result = {
                 'job_id': job.id,
                 'success': False,
                 'error': str(e),
-                'method': application_method,
-                'cover_letter': cover_letter
+                'method': application_method
             }
+            if cover_letter is not None:
+                result['cover_letter'] = cover_letter
+            return result
+    
+    def _needs_cover_letter(self, application_method: str) -> bool:
+        """Whether applying with this method will use a cover letter"""
+        if application_method == 'email':
+            return self.email_configured
+        return application_method in NEEDS_COVER_LETTER
+    
+    def _cover_letter_key(self, user_profile: Mapping, job) -> Tuple:
+        """Cache key for a cover letter: same user, company, title and description"""
+        description = getattr(job, 'description', '') or ''
+        return (
+            user_profile.get('user_id'),
+            getattr(job, 'company', ''),
+            getattr(job, 'title', ''),
+            hashlib.blake2b(description.encode(), digest_size=16).hexdigest()
+        )
+    
+    def _cache_cover_letter(self, key: Tuple, cover_letter: str):
+        """Store a cover letter in the LRU, evicting the oldest entry when full"""
+        self._cover_letter_cache[key] = cover_letter
+        if len(self._cover_letter_cache) > COVER_LETTER_CACHE_SIZE:
+            self._cover_letter_cache.popitem(last=False)
+    
+    async def _get_cover_letter(self, user_profile: Mapping, job) -> str:
+        """Generate a cover letter, reusing one already written for the same user and job"""
+        key = self._cover_letter_key(user_profile, job)
+        cover_letter = self._cover_letter_cache.get(key)
+        if cover_letter is not None:
+            self._cover_letter_cache.move_to_end(key)
+            return cover_letter
+        
+        cover_letter = await self.cover_letter_generator.generate_cover_letter(user_profile, job)
+        self._cache_cover_letter(key, cover_letter)
+        return cover_letter
+    
+    async def _prefetch_cover_letters(self, user_profile: Mapping, jobs: List):
+        """Generate missing cover letters for a batch of jobs with one batched call"""
+        keyed = [(self._cover_letter_key(user_profile, job), job) for job in jobs]
+        missing = [(key, job) for key, job in keyed if key not in self._cover_letter_cache]
+        if not missing:
+            return
+        
+        try:
+            cover_letters = await self.cover_letter_generator.generate_batch(
+                user_profile, [job for _, job in missing]
+            )
+        except Exception as e:
+            # Handlers fall back to generating their own letter on demand
+            logger.warning(f"Batch cover letter generation failed: {e}")
+            return
+        
+        for (key, _), cover_letter in zip(missing, cover_letters):
+            self._cache_cover_letter(key, cover_letter)
     
     def _determine_application_method(self, job) -> str:
         """Determine the best application method for a job"""
         source = getattr(job, 'source', 'unknown')
-        apply_url = getattr(job, 'apply_url', '')
+        apply_url = getattr(job, 'apply_url', '') or ''
+        
+        parsed = urlsplit(apply_url)
         
         # If using HTTP session (not browser), use HTTP-based methods
         if self.browser == "http_session":
-            if 'mailto:' in apply_url:
+            if parsed.scheme == 'mailto':
                 return 'email'
-            else:
-                return 'http_form'  # New HTTP-based form submission
+            portal = _portal_for_host(parsed.hostname or '')
+            if portal in ('linkedin', 'indeed'):
+                return f'http_{portal}'
+            return 'http_form'  # New HTTP-based form submission
         
         # Browser-based methods
         if source in ['linkedin', 'indeed', 'internshala']:
             return source
-        elif 'mailto:' in apply_url:
+        elif parsed.scheme == 'mailto':
             return 'email'
         elif apply_url:
             return 'form'
         else:
             return 'manual'
     
-    async def _apply_http_form(self, user_profile: Dict, job, cover_letter: str) -> Dict:
+    async def _apply_http_form(self, user_profile: Dict, job, get_cover_letter: CoverLetterFactory) -> Dict:
         """Apply to job using HTTP requests instead of browser automation"""
         try:
             apply_url = getattr(job, 'apply_url', '')
@@ -256,26 +539,19 @@ class AutoApplyAgent:
                     'method': 'http_form'
                 }
             
-            # Get the application page to analyze the form
-            response = self.session.get(apply_url)
-            if response.status_code != 200:
-                return {
-                    'job_id': job.id,
-                    'success': False,
-                    'error': f'Failed to access application page: {response.status_code}',
-                    'method': 'http_form'
-                }
-            
-            page_content = response.text
+            # Check the application page is reachable; the body is only read once
+            # there is a form parser to consume it
+            async with self.session.get(apply_url) as response:
+                if response.status != 200:
+                    return {
+                        'job_id': job.id,
+                        'success': False,
+                        'error': f'Failed to access application page: {response.status}',
+                        'method': 'http_form'
+                    }
             
-            # For now, we'll analyze if it's a known job portal and provide specific handling
-            if 'linkedin.com' in apply_url:
-                return await self._apply_http_linkedin(user_profile, job, cover_letter)
-            elif 'indeed.com' in apply_url:
-                return await self._apply_http_indeed(user_profile, job, cover_letter)
-            else:
-                # Generic HTTP form handling
-                return await self._apply_http_generic(user_profile, job, cover_letter, page_content)
+            # Generic HTTP form handling
+            return await self._apply_http_generic(user_profile, job, get_cover_letter)
                     
         except Exception as e:
             logger.error(f"HTTP form application failed for job {job.id}: {e}")
@@ -286,7 +562,7 @@ class AutoApplyAgent:
                 'method': 'http_form'
             }
     
-    async def _apply_http_linkedin(self, user_profile: Dict, job, cover_letter: str) -> Dict:
+    async def _apply_http_linkedin(self, user_profile: Dict, job, get_cover_letter: Optional[CoverLetterFactory]) -> Dict:
         """Apply to LinkedIn job via HTTP (requires LinkedIn session)"""
         return {
             'job_id': job.id,
@@ -296,7 +572,7 @@ class AutoApplyAgent:
             'manual_application_required': True
         }
     
-    async def _apply_http_indeed(self, user_profile: Dict, job, cover_letter: str) -> Dict:
+    async def _apply_http_indeed(self, user_profile: Dict, job, get_cover_letter: Optional[CoverLetterFactory]) -> Dict:
         """Apply to Indeed job via HTTP"""
         return {
             'job_id': job.id,
@@ -306,7 +582,7 @@ class AutoApplyAgent:
             'manual_application_required': True
         }
     
-    async def _apply_http_generic(self, user_profile: Dict, job, cover_letter: str, page_content: str) -> Dict:
+    async def _apply_http_generic(self, user_profile: Dict, job, get_cover_letter: CoverLetterFactory) -> Dict:
         """Apply to generic job form via HTTP"""
         # For now, this is a placeholder that suggests manual application
         # In the future, we could add form parsing and submission logic
@@ -319,12 +595,25 @@ class AutoApplyAgent:
             'message': f'Please visit the application URL to apply: {getattr(job, "apply_url", "")}'
         }
     
-    async def _apply_linkedin(self, user_profile: Dict, job, cover_letter: str) -> Dict:
+    @asynccontextmanager
+    async def _pooled_page(self) -> AsyncIterator[Page]:
+        """Open a fresh page in a pooled browser context, returning the context when done"""
+        if self._context_pool is None:
+            raise RuntimeError("Browser automation is not initialized")
+        
+        context = await self._context_pool.get()
+        try:
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                await page.close()
+        finally:
+            self._context_pool.put_nowait(context)
+    
+    async def _apply_linkedin(self, user_profile: Dict, job, get_cover_letter: CoverLetterFactory) -> Dict:
         """Apply to LinkedIn job"""
         try:
-            if not self.page:
-                self.page = await self.browser.new_page()
-            
             # Navigate to job application page
             apply_url = job.apply_url
             if not apply_url:
@@ -335,42 +624,43 @@ class AutoApplyAgent:
                     'method': 'linkedin'
                 }
             
-            await self.page.goto(apply_url)
-            await wait_random_delay(3, 5)
-            
-            # Check if login is required
-            if '/login' in self.page.url or await self.page.query_selector('input[name="session_key"]'):
+            async with self._pooled_page() as page:
+                await page.goto(apply_url)
+                await wait_random_delay(3, 5)
+                
+                # Check if login is required
+                if '/login' in page.url or await page.query_selector('input[name="session_key"]'):
+                    return {
+                        'job_id': job.id,
+                        'success': False,
+                        'error': 'LinkedIn login required',
+                        'method': 'linkedin'
+                    }
+                
+                # Look for Easy Apply button
+                easy_apply_button = await page.query_selector('.jobs-apply-button')
+                if not easy_apply_button:
+                    return {
+                        'job_id': job.id,
+                        'success': False,
+                        'error': 'Easy Apply button not found',
+                        'method': 'linkedin'
+                    }
+                
+                # Click Easy Apply
+                await easy_apply_button.click()
+                await wait_random_delay(2, 3)
+                
+                # Fill out application form
+                await self._fill_linkedin_application_form(page, user_profile, await get_cover_letter())
+                
                 return {
                     'job_id': job.id,
-                    'success': False,
-                    'error': 'LinkedIn login required',
-                    'method': 'linkedin'
+                    'success': True,
+                    'method': 'linkedin',
+                    'message': 'Applied via LinkedIn Easy Apply'
                 }
             
-            # Look for Easy Apply button
-            easy_apply_button = await self.page.query_selector('.jobs-apply-button')
-            if not easy_apply_button:
-                return {
-                    'job_id': job.id,
-                    'success': False,
-                    'error': 'Easy Apply button not found',
-                    'method': 'linkedin'
-                }
-            
-            # Click Easy Apply
-            await easy_apply_button.click()
-            await wait_random_delay(2, 3)
-            
-            # Fill out application form
-            await self._fill_linkedin_application_form(user_profile, cover_letter)
-            
-            return {
-                'job_id': job.id,
-                'success': True,
-                'method': 'linkedin',
-                'message': 'Applied via LinkedIn Easy Apply'
-            }
-            
         except Exception as e:
             return {
                 'job_id': job.id,
@@ -379,34 +669,50 @@ class AutoApplyAgent:
                 'method': 'linkedin'
             }
     
-    async def _fill_linkedin_application_form(self, user_profile: Dict, cover_letter: str):
+    async def _query_selectors(self, page: Page, selectors) -> List:
+        """Resolve several selectors on a page, CSS ones in a single evaluate call"""
+        selectors = list(selectors)
+        css_selectors = [sel for sel in selectors if not PLAYWRIGHT_SELECTOR_RE.search(sel)]
+        engine_selectors = [sel for sel in selectors if PLAYWRIGHT_SELECTOR_RE.search(sel)]
+        
+        async def query_css() -> List:
+            if not css_selectors:
+                return []
+            matches = await page.evaluate_handle(QUERY_SELECTORS_JS, css_selectors)
+            properties = await matches.get_properties()
+            return [properties[str(i)].as_element() for i in range(len(css_selectors))]
+        
+        css_handles, engine_handles = await asyncio.gather(
+            query_css(),
+            asyncio.gather(*(page.query_selector(sel) for sel in engine_selectors))
+        )
+        found = dict(zip(css_selectors, css_handles))
+        found.update(zip(engine_selectors, engine_handles))
+        return [found[sel] for sel in selectors]
+    
+    def _field_value(self, user_profile: Dict, field_type: str, cover_letter: str) -> str:
+        """Value to fill for a form field type"""
+        if field_type == 'cover_letter':
+            return cover_letter
+        return user_profile.get(field_type, '')
+    
+    async def _fill_linkedin_application_form(self, page: Page, user_profile: Dict, cover_letter: str):
         """Fill out LinkedIn application form"""
         try:
-            # Fill basic information
-            name_field = await self.page.query_selector('input[name="name"]')
-            if name_field:
-                await name_field.fill(user_profile.get('name', ''))
-            
-            email_field = await self.page.query_selector('input[name="email"]')
-            if email_field:
-                await email_field.fill(user_profile.get('email', ''))
-            
-            phone_field = await self.page.query_selector('input[name="phone"]')
-            if phone_field:
-                await phone_field.fill(user_profile.get('phone', ''))
+            *fields, resume_upload, submit_button = await self._query_selectors(
+                page, [sel for sel, _ in LINKEDIN_FIELDS] + [RESUME_UPLOAD_SELECTOR, LINKEDIN_SUBMIT_SELECTOR]
+            )
             
-            # Fill cover letter if there's a text area
-            cover_letter_field = await self.page.query_selector('textarea')
-            if cover_letter_field:
-                await cover_letter_field.fill(cover_letter)
+            # Fill basic information and cover letter
+            for (_, field_type), field in zip(LINKEDIN_FIELDS, fields):
+                if field:
+                    await field.fill(self._field_value(user_profile, field_type, cover_letter))
             
             # Upload resume if file input exists
-            resume_upload = await self.page.query_selector('input[type="file"]')
             if resume_upload and user_profile.get('resume_path'):
                 await resume_upload.set_input_files(user_profile['resume_path'])
             
             # Submit application
-            submit_button = await self.page.query_selector('button[type="submit"]')
             if submit_button:
                 await submit_button.click()
                 await wait_random_delay(2, 3)
@@ -414,12 +720,9 @@ class AutoApplyAgent:
         except Exception as e:
             logger.warning(f"Error filling LinkedIn form: {e}")
     
-    async def _apply_indeed(self, user_profile: Dict, job, cover_letter: str) -> Dict:
+    async def _apply_indeed(self, user_profile: Dict, job, get_cover_letter: CoverLetterFactory) -> Dict:
         """Apply to Indeed job"""
         try:
-            if not self.page:
-                self.page = await self.browser.new_page()
-            
             apply_url = job.apply_url
             if not apply_url:
                 return {
@@ -429,32 +732,33 @@ class AutoApplyAgent:
                     'method': 'indeed'
                 }
             
-            await self.page.goto(apply_url)
-            await wait_random_delay(3, 5)
-            
-            # Look for apply button
-            apply_button = await self.page.query_selector('.np-button, .indeed-apply-button')
-            if not apply_button:
+            async with self._pooled_page() as page:
+                await page.goto(apply_url)
+                await wait_random_delay(3, 5)
+                
+                # Look for apply button
+                apply_button = await page.query_selector('.np-button, .indeed-apply-button')
+                if not apply_button:
+                    return {
+                        'job_id': job.id,
+                        'success': False,
+                        'error': 'Apply button not found',
+                        'method': 'indeed'
+                    }
+                
+                await apply_button.click()
+                await wait_random_delay(2, 3)
+                
+                # Fill application form
+                await self._fill_indeed_application_form(page, user_profile, await get_cover_letter())
+                
                 return {
                     'job_id': job.id,
-                    'success': False,
-                    'error': 'Apply button not found',
-                    'method': 'indeed'
+                    'success': True,
+                    'method': 'indeed',
+                    'message': 'Applied via Indeed'
                 }
             
-            await apply_button.click()
-            await wait_random_delay(2, 3)
-            
-            # Fill application form
-            await self._fill_indeed_application_form(user_profile, cover_letter)
-            
-            return {
-                'job_id': job.id,
-                'success': True,
-                'method': 'indeed',
-                'message': 'Applied via Indeed'
-            }
-            
         except Exception as e:
             return {
                 'job_id': job.id,
@@ -463,30 +767,24 @@ class AutoApplyAgent:
                 'method': 'indeed'
             }
     
-    async def _fill_indeed_application_form(self, user_profile: Dict, cover_letter: str):
+    async def _fill_indeed_application_form(self, page: Page, user_profile: Dict, cover_letter: str):
         """Fill out Indeed application form"""
         try:
-            # Fill contact information
-            fields_mapping = {
-                'input[name*="name"]': user_profile.get('name', ''),
-                'input[name*="email"]': user_profile.get('email', ''),
-                'input[name*="phone"]': user_profile.get('phone', ''),
-                'textarea[name*="cover"]': cover_letter,
-                'textarea[name*="message"]': cover_letter
-            }
+            *fields, resume_upload, submit_button = await self._query_selectors(
+                page, [sel for sel, _ in INDEED_FIELDS] + [RESUME_UPLOAD_SELECTOR, INDEED_SUBMIT_SELECTOR]
+            )
             
-            for selector, value in fields_mapping.items():
-                field = await self.page.query_selector(selector)
+            # Fill contact information
+            for (_, field_type), field in zip(INDEED_FIELDS, fields):
+                value = self._field_value(user_profile, field_type, cover_letter)
                 if field and value:
                     await field.fill(value)
             
             # Upload resume
-            resume_upload = await self.page.query_selector('input[type="file"]')
             if resume_upload and user_profile.get('resume_path'):
                 await resume_upload.set_input_files(user_profile['resume_path'])
             
             # Submit
-            submit_button = await self.page.query_selector('button[type="submit"], input[type="submit"]')
             if submit_button:
                 await submit_button.click()
                 await wait_random_delay(2, 3)
@@ -494,7 +792,7 @@ class AutoApplyAgent:
         except Exception as e:
             logger.warning(f"Error filling Indeed form: {e}")
     
-    async def _apply_internshala(self, user_profile: Dict, job, cover_letter: str) -> Dict:
+    async def _apply_internshala(self, user_profile: Dict, job, get_cover_letter: CoverLetterFactory) -> Dict:
         """Apply to Internshala job"""
         # Similar implementation to LinkedIn/Indeed
         return {
@@ -504,7 +802,7 @@ class AutoApplyAgent:
             'method': 'internshala'
         }
     
-    async def _apply_via_email(self, user_profile: Dict, job, cover_letter: str) -> Dict:
+    async def _apply_via_email(self, user_profile: Dict, job, get_cover_letter: CoverLetterFactory) -> Dict:
         """Apply via email"""
         try:
             # Extract email from apply_url (mailto: links)
@@ -517,16 +815,24 @@ class AutoApplyAgent:
                     'method': 'email'
                 }
             
+            if not self.email_configured:
+                return {
+                    'job_id': job.id,
+                    'success': False,
+                    'error': 'Email credentials not configured',
+                    'method': 'email'
+                }
+            
             recipient_email = apply_url.replace('mailto:', '').split('?')[0]
             
             # Create email
-            subject = f"Application for {job.title} at {job.company}"
+            subject = EMAIL_SUBJECT_TEMPLATE.format(title=job.title, company=job.company)
             
             # Send email
             await self._send_application_email(
                 recipient_email,
                 subject,
-                cover_letter,
+                await get_cover_letter(),
                 user_profile
             )
             
@@ -549,71 +855,100 @@ class AutoApplyAgent:
                                     cover_letter: str, user_profile: Dict):
         """Send application email"""
         
-        # Email configuration
-        smtp_host = os.getenv("EMAIL_HOST", "smtp.gmail.com")
-        smtp_port = int(os.getenv("EMAIL_PORT", 587))
-        email_user = os.getenv("EMAIL_USERNAME")
-        email_password = os.getenv("EMAIL_PASSWORD")
-        
-        if not email_user or not email_password:
+        if not self.email_configured:
             raise ValueError("Email credentials not configured")
         
+        if not AIOSMTPLIB_AVAILABLE:
+            raise RuntimeError("aiosmtplib is not installed")
+        
         # Create message
         message = MIMEMultipart()
-        message["From"] = email_user
+        message["From"] = self._email_cfg.user
         message["To"] = recipient
         message["Subject"] = subject
         
         # Add cover letter as body
         message.attach(MIMEText(cover_letter, "plain"))
         
-        # Attach resume if available
-        if user_profile.get('resume_path'):
-            try:
-                with open(user_profile['resume_path'], 'rb') as f:
-                    resume_attachment = MIMEText(f.read(), 'base64', 'utf-8')
-                    resume_attachment.add_header(
-                        'Content-Disposition',
-                        f'attachment; filename="{user_profile.get("name", "resume")}_resume.pdf"'
-                    )
-                    message.attach(resume_attachment)
-            except Exception as e:
-                logger.warning(f"Could not attach resume: {e}")
-        
-        # Send email
+        # Send email over the shared connection, reconnecting once if the server dropped it
         try:
-            await aiosmtplib.send(
-                message,
-                hostname=smtp_host,
-                port=smtp_port,
-                start_tls=True,
-                username=email_user,
-                password=email_password
-            )
+            async with self._smtp_lock:
+                # Read the resume while the SMTP connection is being established
+                resume, smtp = await asyncio.gather(
+                    self._load_resume_attachment(user_profile),
+                    self._get_smtp()
+                )
+                if resume is not None:
+                    message.attach(resume)
+                
+                try:
+                    await smtp.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    self._smtp = None
+                    smtp = await self._get_smtp()
+                    await smtp.send_message(message)
             logger.info(f"Application email sent to {recipient}")
         except Exception as e:
             logger.error(f"Failed to send email: {e}")
             raise
     
-    async def _apply_via_form(self, user_profile: Dict, job, cover_letter: str) -> Dict:
+    async def _load_resume_attachment(self, user_profile: Dict) -> Optional[MIMEApplication]:
+        """Return the resume attachment for a profile, or None if there is none or it can't be read"""
+        if not user_profile.get('resume_path'):
+            return None
+        try:
+            return await self._get_resume_attachment(
+                user_profile['resume_path'], user_profile.get("name", "resume")
+            )
+        except Exception as e:
+            logger.warning(f"Could not attach resume: {e}")
+            return None
+    
+    async def _get_resume_attachment(self, path: str, name: str) -> MIMEApplication:
+        """Return the base64-encoded resume part, re-reading the file only when it changes"""
+        st = os.stat(path)
+        filename = RESUME_FILENAME_TEMPLATE.format(name=name)
+        key = (path, st.st_mtime, st.st_size, filename)
+        
+        attachment = self._resume_cache.get(key)
+        if attachment is None:
+            async with aiofiles.open(path, 'rb') as f:
+                data = await f.read()
+            attachment = MIMEApplication(data, _subtype='pdf')
+            attachment.add_header('Content-Disposition', 'attachment', filename=filename)
+            # Drop stale versions of this file before caching the new one
+            for stale in [k for k in self._resume_cache if k[0] == path]:
+                del self._resume_cache[stale]
+            self._resume_cache[key] = attachment
+        return attachment
+    
+    async def _get_smtp(self):
+        """Return the connected SMTP client, connecting and logging in on first use"""
+        if self._smtp is None or not self._smtp.is_connected:
+            cfg = self._email_cfg
+            client = aiosmtplib.SMTP(hostname=cfg.host, port=cfg.port, start_tls=True)
+            await client.connect()
+            await client.login(cfg.user, cfg.password)
+            self._smtp = client
+        return self._smtp
+    
+    async def _apply_via_form(self, user_profile: Dict, job, get_cover_letter: CoverLetterFactory) -> Dict:
         """Apply via web form"""
         try:
-            if not self.page:
-                self.page = await self.browser.new_page()
-            
             apply_url = job.apply_url
-            await self.page.goto(apply_url)
-            await wait_random_delay(3, 5)
-            
-            # Generic form filling
-            await self._fill_generic_application_form(user_profile, cover_letter)
-            
-            return {
-                'job_id': job.id,
-                'success': True,
-                'method': 'form',
-                'message': 'Applied via web form'
-            }
+            async with self._pooled_page() as page:
+                await page.goto(apply_url)
+                await wait_random_delay(3, 5)
+                
+                # Generic form filling
+                await self._fill_generic_application_form(page, user_profile, await get_cover_letter())
+                
+                return {
+                    'job_id': job.id,
+                    'success': True,
+                    'method': 'form',
+                    'message': 'Applied via web form'
+                }
             
         except Exception as e:
             return {
@@ -623,53 +958,97 @@ class AutoApplyAgent:
                 'method': 'form'
             }
     
-    async def _fill_generic_application_form(self, user_profile: Dict, cover_letter: str):
+    async def _fill_generic_application_form(self, page: Page, user_profile: Dict, cover_letter: str):
         """Fill generic application form"""
         try:
-            # Common field patterns
-            field_patterns = {
-                'name': ['input[name*="name"]', 'input[id*="name"]'],
-                'email': ['input[name*="email"]', 'input[id*="email"]'],
-                'phone': ['input[name*="phone"]', 'input[id*="phone"]'],
-                'cover_letter': ['textarea[name*="cover"]', 'textarea[name*="message"]', 'textarea']
-            }
+            # Forms with a layout seen before skip pattern matching entirely
+            signature = await self._form_signature(page)
+            filler = self._ats_fillers.get(signature)
+            if filler:
+                await filler(page, user_profile, cover_letter)
+                return
             
-            # Fill fields
-            for field_type, selectors in field_patterns.items():
-                for selector in selectors:
-                    field = await self.page.query_selector(selector)
-                    if field:
-                        value = user_profile.get(field_type, '')
-                        if field_type == 'cover_letter':
-                            value = cover_letter
-                        if value:
-                            await field.fill(value)
-                        break
+            # Probe every candidate selector in one batch
+            field_selectors = [sel for _, selectors in FIELD_PATTERNS for sel in selectors]
+            handles = await self._query_selectors(
+                page, field_selectors + [RESUME_UPLOAD_SELECTOR] + list(SUBMIT_SELECTORS)
+            )
+            found = dict(zip(field_selectors, handles))
+            file_input = handles[len(field_selectors)]
+            submit_handles = handles[len(field_selectors) + 1:]
             
-            # Upload resume
-            file_input = await self.page.query_selector('input[type="file"]')
-            if file_input and user_profile.get('resume_path'):
-                await file_input.set_input_files(user_profile['resume_path'])
-            
-            # Submit form
-            submit_selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button:has-text("Submit")',
-                'button:has-text("Apply")'
-            ]
-            
-            for selector in submit_selectors:
-                submit_button = await self.page.query_selector(selector)
-                if submit_button:
-                    await submit_button.click()
-                    await wait_random_delay(2, 3)
-                    break
+            # Use the first matching selector for each field
+            fields = []
+            for field_type, selectors in FIELD_PATTERNS:
+                selector = next((sel for sel in selectors if found[sel]), None)
+                if selector:
+                    fields.append((selector, field_type))
+            submit_selector = next(
+                (sel for sel, handle in zip(SUBMIT_SELECTORS, submit_handles) if handle), None
+            )
+            
+            # Remember the resolved selectors for the next form with this layout
+            if len(self._ats_fillers) >= FORM_FILLER_CACHE_SIZE:
+                del self._ats_fillers[next(iter(self._ats_fillers))]
+            self._ats_fillers[signature] = self._compile_form_filler(
+                tuple(fields), RESUME_UPLOAD_SELECTOR if file_input else None, submit_selector
+            )
+            
+            await self._fill_form_handles(
+                user_profile, cover_letter,
+                [(found[sel], field_type) for sel, field_type in fields],
+                file_input,
+                submit_handles[SUBMIT_SELECTORS.index(submit_selector)] if submit_selector else None
+            )
             
         except Exception as e:
             logger.warning(f"Error filling generic form: {e}")
     
-    async def _apply_generic(self, user_profile: Dict, job, cover_letter: str) -> Dict:
+    async def _form_signature(self, page: Page) -> str:
+        """Hash of a page's form controls, identifying its form layout"""
+        description = await page.evaluate(FORM_SIGNATURE_JS)
+        return hashlib.blake2b(description.encode(), digest_size=16).hexdigest()
+    
+    def _compile_form_filler(self, fields: Tuple[Tuple[str, str], ...], file_selector: Optional[str],
+                             submit_selector: Optional[str]) -> Callable[[Page, Dict, str], Awaitable[None]]:
+        """Build a filler for a known form layout that only resolves the selectors it uses"""
+        selectors = [sel for sel, _ in fields]
+        if file_selector:
+            selectors.append(file_selector)
+        if submit_selector:
+            selectors.append(submit_selector)
+        
+        async def fill(page: Page, user_profile: Dict, cover_letter: str):
+            handles = list(await self._query_selectors(page, selectors)) if selectors else []
+            submit_button = handles.pop() if submit_selector else None
+            file_input = handles.pop() if file_selector else None
+            await self._fill_form_handles(
+                user_profile, cover_letter,
+                [(handle, field_type) for handle, (_, field_type) in zip(handles, fields)],
+                file_input, submit_button
+            )
+        
+        return fill
+    
+    async def _fill_form_handles(self, user_profile: Dict, cover_letter: str, fields: List,
+                                 file_input, submit_button):
+        """Fill resolved (handle, field type) pairs, upload the resume and submit"""
+        for field, field_type in fields:
+            if field:
+                value = self._field_value(user_profile, field_type, cover_letter)
+                if value:
+                    await field.fill(value)
+        
+        # Upload resume
+        if file_input and user_profile.get('resume_path'):
+            await file_input.set_input_files(user_profile['resume_path'])
+        
+        # Submit form
+        if submit_button:
+            await submit_button.click()
+            await wait_random_delay(2, 3)
+    
+    async def _apply_generic(self, user_profile: Dict, job, get_cover_letter: Optional[CoverLetterFactory]) -> Dict:
         """Generic application method"""
         return {
             'job_id': job.id,
@@ -679,61 +1058,86 @@ class AutoApplyAgent:
             'message': 'This job requires manual application'
         }
     
-    async def _get_user_profile(self, user_id: int) -> Optional[Dict]:
-        """Get user profile for applications"""
+    async def _get_user_profile(self, user_id: int) -> Optional[Mapping]:
+        """Get user profile for applications, read-only as it is shared by one call's concurrent workers"""
         user = await database.get_user_by_id(user_id)
         if not user:
             return None
         
-        return {
+        preferences = user.get_preferences()
+        profile = MappingProxyType({
             'user_id': user_id,
             'name': user.name,
             'email': user.email,
-            'phone': user.get_preferences().get('phone', ''),
+            'phone': preferences.get('phone', ''),
             'resume_path': user.resume_path,
             'skills': user.get_skills(),
             'experience_years': user.experience_years,
             'location': user.location,
-            **user.get_preferences()
-        }
+            **preferences
+        })
+        return profile
     
-    async def _get_job_details(self, job_id: int):
-        """Get job details from database"""
+    async def _get_jobs_details(self, job_ids: List[int]) -> Dict:
+        """Get job details for a batch of jobs from database"""
         try:
-            from database.db_connection import database
-            job = await database.get_job_by_id(job_id)
-            return job
+            return await database.get_jobs_by_ids(job_ids)
         except Exception as e:
-            logger.error(f"Error fetching job {job_id}: {e}")
-            return None
+            logger.error(f"Error fetching jobs {job_ids}: {e}")
+            return {}
     
-    async def _check_existing_application(self, user_id: int, job_id: int) -> bool:
-        """Check if user has already applied to this job"""
-        # This would check the database for existing applications
-        # For now, return False
-        return False
+    async def _get_existing_applications(self, user_id: int, job_ids: List[int]) -> set:
+        """Get the IDs of jobs in the batch the user has already applied to"""
+        try:
+            return await database.get_existing_applications(user_id, job_ids)
+        except Exception as e:
+            logger.error(f"Error checking existing applications for user {user_id}: {e}")
+            return set()
     
-    async def _record_application(self, user_id: int, job_id: int, application_result: Dict):
-        """Record application in database"""
-        application_data = {
+    def _build_application_record(self, user_id: int, job_id: int, application_result: Dict) -> Dict:
+        """Build the database row for a successful application (applied_at is set when the batch is saved)"""
+        return {
             'user_id': user_id,
             'job_id': job_id,
-            'applied_at': datetime.utcnow(),
             'status': 'applied',
             'cover_letter': application_result.get('cover_letter', ''),
             'auto_applied': True,
             'application_method': application_result.get('method', 'unknown'),
             'notes': application_result.get('message', '')
         }
+    
+    async def _record_applications(self, records: List[Dict]):
+        """Record a batch of applications in database with a single insert"""
+        if not records:
+            return
+        
+        # Applications in a batch share one timestamp
+        applied_at = datetime.now(timezone.utc)
+        for record in records:
+            record['applied_at'] = applied_at
         
-        # This would save to database
-        logger.info(f"Recorded application for user {user_id} to job {job_id}")
+        try:
+            await database.save_applications(records)
+            logger.info(f"Recorded {len(records)} applications for user {records[0]['user_id']}")
+        except Exception as e:
+            logger.error(f"Failed to record applications: {e}")
     
     async def _get_applications_today(self) -> int:
-        """Get number of applications made today"""
-        # This would query the database for today's applications
-        # For now, return 0
-        return 0
+        """Get number of applications made today (UTC), querying at most every APPLICATIONS_TODAY_TTL seconds"""
+        now = time.monotonic()
+        if self._applications_today_checked is not None and now - self._applications_today_checked < APPLICATIONS_TODAY_TTL:
+            # Applications since the last query are already counted in memory
+            return self.applications_today
+        
+        try:
+            midnight = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+            count = await database.count_auto_applications_since(midnight)
+        except Exception as e:
+            logger.error(f"Error counting today's applications: {e}")
+            return self.applications_today
+        
+        self._applications_today_checked = now
+        return count
     
     def is_healthy(self) -> bool:
         """Check if the auto-apply agent is healthy"""
@@ -5,15 +5,20 @@ Scrapes job listings from LinkedIn, Indeed, Internshala, and other job portals
 
 import asyncio
 import logging
+import os
 import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import islice
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 import json
 
-from playwright.async_api import async_playwright, Page, Browser
-from bs4 import BeautifulSoup
-import requests
+import httpx
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from lxml import etree
 
 from backend.database.db_connection import database
 from backend.utils.scraper_helpers import (
@@ -21,23 +26,132 @@ from backend.utils.scraper_helpers import (
     extract_salary, 
     parse_job_date, 
     generate_user_agent,
-    wait_random_delay
+    TokenBucket
 )
 
 logger = logging.getLogger(__name__)
 
+# Where each portal's browser cookies and local storage are kept between runs
+BROWSER_STATE_DIR = os.getenv("SCRAPER_BROWSER_STATE_DIR", "scraper_state")
+
+# Concurrency per kind of portal: plain HTTP fetches are cheap, while every
+# browser page costs a renderer process, so the two are bounded separately
+HTTP_MAX_CONCURRENT_FETCHES = 8
+BROWSER_MAX_CONCURRENT_PAGES = 2
+
+# Scraped jobs flow from the portal scrapers to the saver through a bounded
+# queue and are written to the database in batches
+SCRAPE_QUEUE_SIZE = 500
+SAVE_BATCH_SIZE = 100
+
+# Request pacing per portal (requests per second) and backoff on throttling responses
+PORTAL_RATE_LIMITS = {'linkedin': 1.0, 'indeed': 2.0, 'internshala': 2.0}
+RETRY_STATUSES = frozenset({429, 503})
+MAX_FETCH_ATTEMPTS = 4
+INITIAL_BACKOFF = 2.0  # seconds, doubled after every throttled attempt
+
+# Indeed result pages are parsed while they download; cards are the divs with this class
+INDEED_CARD_CLASS = 'job_seen_beacon'
+INDEED_STREAM_CHUNK_SIZE = 65536
+
+# Subresources the scrapers never read; aborting them keeps page loads to the DOM
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+# How long to wait for a portal's job cards to render
+CARD_WAIT_TIMEOUT = 10000  # milliseconds
+
+# Reads the given fields from the first `limit` job cards on a page in a single
+# browser round trip; each field is (name, selector, attribute or null for text)
+EXTRACT_CARDS_JS = """([cardSelector, limit, fields]) =>
+    Array.from(document.querySelectorAll(cardSelector)).slice(0, limit).map(card => {
+        const data = {};
+        for (const [name, selector, attribute] of fields) {
+            const el = card.querySelector(selector);
+            data[name] = el ? (attribute ? el.getAttribute(attribute) : el.innerText) : null;
+        }
+        return data;
+    })"""
+
+LINKEDIN_CARD_FIELDS = [
+    ('title', '.job-search-card__title', None),
+    ('company', '.job-search-card__subtitle-link', None),
+    ('location', '.job-search-card__location', None),
+    ('url', '.job-search-card__title a', 'href'),
+]
+
+INTERNSHALA_CARD_FIELDS = [
+    ('title', '.job-title', None),
+    ('company', '.company-name', None),
+    ('location', '.location-names', None),
+    ('salary', '.salary', None),
+    ('url', 'a', 'href'),
+]
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains `name`"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Indeed field lookups, compiled once and evaluated in C by lxml
+_XP_INDEED_TITLE = etree.XPath(f".//h2[{_has_class('jobTitle')}]//text()")
+_XP_INDEED_COMPANY = etree.XPath(f".//span[{_has_class('companyName')}]//text()")
+_XP_INDEED_LOCATION = etree.XPath(f".//div[{_has_class('companyLocation')}]//text()")
+_XP_INDEED_SALARY = etree.XPath(f".//span[{_has_class('salaryText')}]//text()")
+_XP_INDEED_HREF = etree.XPath(f"(.//h2[{_has_class('jobTitle')}]//a/@href)[1]")
+
+
+def _xpath_text(xpath: etree.XPath, node) -> str:
+    """Concatenate the stripped text nodes an XPath selects under `node`"""
+    return "".join(text.strip() for text in xpath(node))
+
+
+# Company, location and salary strings repeat across cards and pages, so the
+# normalized forms are memoized instead of re-cleaned for every job
+@lru_cache(maxsize=8192)
+def _clean(text: str) -> str:
+    """Memoized clean_text"""
+    return clean_text(text)
+
+
+@lru_cache(maxsize=8192)
+def _extract_salary(salary_text: str) -> Tuple[Optional[float], Optional[float]]:
+    """Memoized extract_salary"""
+    return extract_salary(salary_text)
+
+
+def _job_key(job: Dict) -> bytes:
+    """Compact title/company key that scraped jobs are deduplicated on"""
+    return (job.get('title', '').lower() + '\x00' + job.get('company', '').lower()).encode()
+
+
+def _ext_id(prefix: str, *parts: str) -> str:
+    """Stable external job ID; unlike hash(), it is the same in every process"""
+    digest = blake2b('\x00'.join(parts).encode(), digest_size=8).hexdigest()
+    return f"{prefix}_{digest}"
+
 
 class ScraperAgent:
     """Autonomous agent for scraping job listings from multiple portals"""
     
     def __init__(self):
         self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+        
+        # One browser context per portal, created on first use; portals keep
+        # their own cookies and cache and can navigate in parallel
+        self.contexts: Dict[str, BrowserContext] = {}
+        
+        # Per-portal request pacing, so fetches never fire back-to-back
+        self.limiters: Dict[str, TokenBucket] = {
+            portal: TokenBucket(rate=rate) for portal, rate in PORTAL_RATE_LIMITS.items()
+        }
         self.scraped_jobs: List[Dict] = []
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': generate_user_agent()
-        })
+        
+        # Pooled keep-alive HTTP/2 client for portals scraped without a browser,
+        # created in initialize()
+        self.http: Optional[httpx.AsyncClient] = None
+        self.http_semaphore = asyncio.BoundedSemaphore(HTTP_MAX_CONCURRENT_FETCHES)
+        self.browser_semaphore = asyncio.BoundedSemaphore(BROWSER_MAX_CONCURRENT_PAGES)
         
         # Portal configurations
         self.portals = {
@@ -58,6 +172,14 @@ class ScraperAgent:
     async def initialize(self):
         """Initialize the scraper agent"""
         try:
+            self.http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30),
+                headers={'User-Agent': generate_user_agent()},
+                timeout=30,
+                follow_redirects=True
+            )
+            
             playwright = await async_playwright().start()
             self.browser = await playwright.chromium.launch(
                 headless=True,
@@ -70,11 +192,14 @@ class ScraperAgent:
     
     async def cleanup(self):
         """Clean up resources"""
-        if self.page:
-            await self.page.close()
+        for portal, context in self.contexts.items():
+            await self._save_browser_state(portal, context)
+            await context.close()
+        self.contexts = {}
         if self.browser:
             await self.browser.close()
-        self.session.close()
+        if self.http:
+            await self.http.aclose()
     
     async def scrape_jobs(self, search_params: Dict) -> List[Dict]:
         """
@@ -101,50 +226,28 @@ class ScraperAgent:
             message=f"Starting job search with params: {search_params}"
         )
         
-        for portal_name, portal_config in self.portals.items():
-            try:
-                logger.info(f"Scraping {portal_name}...")
-                
-                # Create scraping log entry
-                scraping_log_id = await self._create_scraping_log(
-                    portal_name, search_params
-                )
-                
-                # Scrape jobs from this portal
-                portal_jobs = await portal_config['scraper'](search_params)
-                
-                # Add portal metadata to jobs
-                for job in portal_jobs:
-                    job['source'] = portal_name
-                    job['scraped_at'] = datetime.utcnow().isoformat()
-                
-                self.scraped_jobs.extend(portal_jobs)
-                total_jobs += len(portal_jobs)
-                
-                # Update scraping log
-                await self._update_scraping_log(
-                    scraping_log_id, len(portal_jobs), "completed"
-                )
-                
-                logger.info(f"Scraped {len(portal_jobs)} jobs from {portal_name}")
-                
-                # Stop if we've reached max jobs
-                if total_jobs >= max_jobs:
-                    break
-                
-                # Random delay between portals
-                await wait_random_delay(2, 5)
-                
-            except Exception as e:
-                logger.error(f"Error scraping {portal_name}: {e}")
-                await self._update_scraping_log(
-                    scraping_log_id, 0, "failed", str(e)
-                )
+        # Jobs from one run share a single scrape timestamp
+        scraped_at = datetime.utcnow().isoformat()
+        
+        # Portals stream jobs into the queue while the saver deduplicates and
+        # stores them; each portal handles and logs its own failures
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SCRAPE_QUEUE_SIZE)
+        saver = asyncio.create_task(self._save_scraped_jobs(queue, max_jobs))
+        
+        portal_results = await asyncio.gather(
+            *(self._run_portal(portal_name, portal_config, search_params, queue, scraped_at)
+              for portal_name, portal_config in self.portals.items()),
+            return_exceptions=True
+        )
+        await queue.put(None)
+        
+        for portal_name, portal_count in zip(self.portals, portal_results):
+            if isinstance(portal_count, BaseException):
+                logger.error(f"Error scraping {portal_name}: {portal_count}")
                 continue
+            total_jobs += portal_count
         
-        # Remove duplicates and save to database
-        unique_jobs = self._remove_duplicates(self.scraped_jobs)
-        saved_jobs = await database.save_jobs(unique_jobs[:max_jobs])
+        saved_jobs = await saver
         
         await database.log_system_activity(
             agent_name="scraper_agent",
@@ -155,75 +258,220 @@ class ScraperAgent:
         
         return saved_jobs
     
-    async def _scrape_linkedin(self, search_params: Dict) -> List[Dict]:
-        """Scrape jobs from LinkedIn"""
-        jobs = []
-        
+    async def _run_portal(self, portal_name: str, portal_config: Dict, search_params: Dict,
+                          queue: asyncio.Queue, scraped_at: str) -> int:
+        """Stream a single portal's jobs into the queue and record its scraping log; returns the job count"""
+        scraping_log_id = None
+        portal_jobs = 0
         try:
-            if not self.page:
-                self.page = await self.browser.new_page()
+            logger.info(f"Scraping {portal_name}...")
             
-            # Build LinkedIn search URL
-            keywords = search_params.get('keywords', '')
-            location = search_params.get('location', '')
+            # Create scraping log entry
+            scraping_log_id = await self._create_scraping_log(
+                portal_name, search_params
+            )
             
-            params = {
-                'keywords': keywords,
-                'location': location,
-                'f_TP': '1',  # Past 24 hours
-                'f_E': '1,2' if search_params.get('experience_level') == 'entry' else '3,4'
-            }
+            # Hand each job on as soon as it is extracted, with portal metadata
+            async for job in portal_config['scraper'](search_params):
+                job['source'] = portal_name
+                job['scraped_at'] = scraped_at
+                await queue.put(job)
+                portal_jobs += 1
             
-            url = f"https://www.linkedin.com/jobs/search?"
-            url += "&".join([f"{k}={v}" for k, v in params.items()])
+            # Update scraping log
+            await self._update_scraping_log(
+                scraping_log_id, portal_jobs, "completed"
+            )
             
-            await self.page.goto(url, wait_until='networkidle')
-            await wait_random_delay(3, 6)
+            logger.info(f"Scraped {portal_jobs} jobs from {portal_name}")
+            return portal_jobs
             
-            # Extract job cards
-            job_cards = await self.page.query_selector_all('.job-search-card')
+        except Exception as e:
+            logger.error(f"Error scraping {portal_name}: {e}")
+            await self._update_scraping_log(
+                scraping_log_id, portal_jobs, "failed", str(e)
+            )
+            return portal_jobs
+    
+    async def _save_scraped_jobs(self, queue: asyncio.Queue, max_jobs: int) -> List:
+        """Drain the queue until a None sentinel, saving up to max_jobs unique jobs in batches"""
+        saved_jobs = []
+        batch = []
+        accepted = 0
+        error: Optional[Exception] = None
+        
+        # Title/company keys of jobs saved during this run and of those waiting in the
+        # batch; jobs from earlier runs are skipped by the database's unique external ID
+        saved_keys = set()
+        batch_keys = set()
+        
+        async def flush():
+            nonlocal accepted, error
+            try:
+                saved_jobs.extend(await database.save_jobs(batch))
+                # Only jobs that reached the database count as seen
+                saved_keys.update(batch_keys)
+            except Exception as e:
+                # Keep draining so the portal scrapers never block on a full queue;
+                # the failed jobs may be accepted again if they turn up later
+                error = error or e
+                accepted -= len(batch)
+            batch.clear()
+            batch_keys.clear()
+        
+        while (job := await queue.get()) is not None:
+            self.scraped_jobs.append(job)
+            key = _job_key(job)
+            if accepted >= max_jobs or key in saved_keys or key in batch_keys:
+                continue
+            accepted += 1
+            batch.append(job)
+            batch_keys.add(key)
+            if len(batch) >= SAVE_BATCH_SIZE:
+                await flush()
+        
+        if batch:
+            await flush()
+        if error:
+            raise error
+        return saved_jobs
+    
+    async def _get_page(self, portal: str) -> Page:
+        """Open a new page in the portal's own browser context"""
+        context = self.contexts.get(portal)
+        if context is None:
+            context = await self._new_context(portal)
+            await context.route("**/*", self._block_heavy_resources)
+            self.contexts[portal] = context
+        return await context.new_page()
+    
+    async def _new_context(self, portal: str) -> BrowserContext:
+        """Create a browser context, restoring the portal's cookies from the last run if saved"""
+        state_path = os.path.join(BROWSER_STATE_DIR, f"{portal}.json")
+        if os.path.exists(state_path):
+            try:
+                return await self.browser.new_context(
+                    user_agent=generate_user_agent(), storage_state=state_path
+                )
+            except Exception as e:
+                logger.warning(f"Could not restore browser state for {portal}: {e}")
+        return await self.browser.new_context(user_agent=generate_user_agent())
+    
+    async def _save_browser_state(self, portal: str, context: BrowserContext):
+        """Save the portal's cookies and local storage so the next run starts warm"""
+        try:
+            os.makedirs(BROWSER_STATE_DIR, exist_ok=True)
+            await context.storage_state(path=os.path.join(BROWSER_STATE_DIR, f"{portal}.json"))
+        except Exception as e:
+            logger.warning(f"Could not save browser state for {portal}: {e}")
+    
+    async def _fetch_with_backoff(self, portal: str, fetch: Callable[[], Awaitable]):
+        """Run a portal request under its rate limit, backing off exponentially on 429/503"""
+        backoff = INITIAL_BACKOFF
+        for attempt in range(1, MAX_FETCH_ATTEMPTS + 1):
+            await self.limiters[portal].acquire()
+            response = await fetch()
+            
+            # httpx responses carry status_code, Playwright navigations status
+            if isinstance(response, httpx.Response):
+                status = response.status_code
+            else:
+                status = response.status if response else None
+            
+            if status not in RETRY_STATUSES or attempt == MAX_FETCH_ATTEMPTS:
+                return response
+            
+            logger.warning(f"{portal} responded {status}, retrying in {backoff:.0f}s")
+            if isinstance(response, httpx.Response):
+                await response.aclose()
+            await asyncio.sleep(backoff)
+            backoff *= 2
+    
+    async def _block_heavy_resources(self, route: Route):
+        """Abort image, font, media and stylesheet requests; let everything else through"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _wait_for_cards(self, page: Page, card_selector: str) -> bool:
+        """Wait until job cards are in the DOM; False if none appear in time"""
+        try:
+            await page.wait_for_selector(card_selector, timeout=CARD_WAIT_TIMEOUT)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+    
+    async def _scrape_linkedin(self, search_params: Dict) -> AsyncIterator[Dict]:
+        """Scrape jobs from LinkedIn"""
+        page = None
+        
+        try:
+            async with self.browser_semaphore:
+                page = await self._get_page('linkedin')
+                
+                # Build LinkedIn search URL
+                keywords = search_params.get('keywords', '')
+                location = search_params.get('location', '')
+                
+                params = {
+                    'keywords': keywords,
+                    'location': location,
+                    'f_TP': '1',  # Past 24 hours
+                    'f_E': '1,2' if search_params.get('experience_level') == 'entry' else '3,4'
+                }
+                
+                url = f"https://www.linkedin.com/jobs/search?"
+                url += "&".join([f"{k}={v}" for k, v in params.items()])
+                
+                await self._fetch_with_backoff(
+                    'linkedin', lambda: page.goto(url, wait_until='domcontentloaded')
+                )
+                if not await self._wait_for_cards(page, '.job-search-card'):
+                    logger.info("No LinkedIn job cards found")
+                    return
+                
+                # Extract job cards (limit to 20 jobs per portal)
+                job_cards = await page.evaluate(
+                    EXTRACT_CARDS_JS, ['.job-search-card', 20, LINKEDIN_CARD_FIELDS]
+                )
             
-            for card in job_cards[:20]:  # Limit to 20 jobs per portal
+            for card in job_cards:
                 try:
-                    job_data = await self._extract_linkedin_job(card)
+                    job_data = self._extract_linkedin_job(card)
                     if job_data:
-                        jobs.append(job_data)
+                        yield job_data
                 except Exception as e:
                     logger.warning(f"Error extracting LinkedIn job: {e}")
                     continue
             
         except Exception as e:
             logger.error(f"LinkedIn scraping error: {e}")
-        
-        return jobs
+        finally:
+            if page:
+                await page.close()
     
-    async def _extract_linkedin_job(self, card) -> Optional[Dict]:
-        """Extract job data from LinkedIn job card"""
+    def _extract_linkedin_job(self, card: Dict) -> Optional[Dict]:
+        """Extract job data from LinkedIn job card fields read in the page"""
         try:
             # Extract basic info
-            title_elem = await card.query_selector('.job-search-card__title')
-            title = await title_elem.inner_text() if title_elem else "Unknown"
-            
-            company_elem = await card.query_selector('.job-search-card__subtitle-link')
-            company = await company_elem.inner_text() if company_elem else "Unknown"
-            
-            location_elem = await card.query_selector('.job-search-card__location')
-            location = await location_elem.inner_text() if location_elem else "Unknown"
+            title = card.get('title') or "Unknown"
+            company = card.get('company') or "Unknown"
+            location = card.get('location') or "Unknown"
             
             # Extract job URL
-            link_elem = await card.query_selector('.job-search-card__title a')
-            job_url = await link_elem.get_attribute('href') if link_elem else ""
+            job_url = card.get('url') or ""
             if job_url and not job_url.startswith('http'):
                 job_url = f"https://www.linkedin.com{job_url}"
             
             # Generate external ID
-            external_id = f"linkedin_{hash(f'{title}_{company}_{location}')}"
+            external_id = _ext_id('linkedin', title, company, location)
             
             return {
                 'external_id': external_id,
-                'title': clean_text(title),
-                'company': clean_text(company),
-                'location': clean_text(location),
+                'title': _clean(title),
+                'company': _clean(company),
+                'location': _clean(location),
                 'apply_url': job_url,
                 'posted_date': datetime.utcnow() - timedelta(days=1),  # Approximate
                 'job_type': 'full-time',  # Default
@@ -235,12 +483,11 @@ class ScraperAgent:
             logger.warning(f"Error extracting LinkedIn job data: {e}")
             return None
     
-    async def _scrape_indeed(self, search_params: Dict) -> List[Dict]:
+    async def _scrape_indeed(self, search_params: Dict) -> AsyncIterator[Dict]:
         """Scrape jobs from Indeed"""
-        jobs = []
         
         try:
-            # Use requests for Indeed (simpler structure)
+            # Fetch Indeed over plain HTTP (simpler structure, no browser needed)
             keywords = search_params.get('keywords', '')
             location = search_params.get('location', '')
             
@@ -252,60 +499,82 @@ class ScraperAgent:
             }
             
             url = "https://www.indeed.com/jobs"
-            response = self.session.get(url, params=params)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                job_cards = soup.find_all('div', class_='job_seen_beacon')
-                
-                for card in job_cards[:20]:
-                    try:
-                        job_data = self._extract_indeed_job(card)
-                        if job_data:
-                            jobs.append(job_data)
-                    except Exception as e:
-                        logger.warning(f"Error extracting Indeed job: {e}")
-                        continue
+            request = self.http.build_request('GET', url, params=params)
+            async with self.http_semaphore:
+                response = await self._fetch_with_backoff(
+                    'indeed', lambda: self.http.send(request, stream=True)
+                )
+                try:
+                    if response.status_code == 200:
+                        async for card in self._stream_indeed_cards(response, limit=20):
+                            try:
+                                job_data = self._extract_indeed_job(card)
+                                if job_data:
+                                    yield job_data
+                            except Exception as e:
+                                logger.warning(f"Error extracting Indeed job: {e}")
+                                continue
+                            finally:
+                                card.clear()
+                finally:
+                    await response.aclose()
             
         except Exception as e:
             logger.error(f"Indeed scraping error: {e}")
+    
+    async def _stream_indeed_cards(self, response: httpx.Response, limit: int):
+        """Parse the response body as it downloads, yielding each job card element once it is complete"""
+        parser = etree.HTMLPullParser(events=('end',), tag='div')
+        
+        def completed_cards():
+            for _, elem in parser.read_events():
+                if INDEED_CARD_CLASS in (elem.get('class') or '').split():
+                    yield elem
         
-        return jobs
+        found = 0
+        async for chunk in response.aiter_bytes(INDEED_STREAM_CHUNK_SIZE):
+            parser.feed(chunk)
+            for elem in completed_cards():
+                yield elem
+                found += 1
+                if found >= limit:
+                    return
+        
+        # Flush what the parser still buffers at the end of the page, e.g. a last card
+        # whose closing tags never arrived
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            # An empty body: there is nothing to flush
+            return
+        for elem in islice(completed_cards(), limit - found):
+            yield elem
     
     def _extract_indeed_job(self, card) -> Optional[Dict]:
-        """Extract job data from Indeed job card"""
+        """Extract job data from an Indeed job card (lxml element)"""
         try:
-            # Extract title
-            title_elem = card.find('h2', class_='jobTitle')
-            title = title_elem.get_text(strip=True) if title_elem else "Unknown"
-            
-            # Extract company
-            company_elem = card.find('span', class_='companyName')
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown"
-            
-            # Extract location
-            location_elem = card.find('div', class_='companyLocation')
-            location = location_elem.get_text(strip=True) if location_elem else "Unknown"
+            # Extract title, company and location
+            title = _xpath_text(_XP_INDEED_TITLE, card) or "Unknown"
+            company = _xpath_text(_XP_INDEED_COMPANY, card) or "Unknown"
+            location = _xpath_text(_XP_INDEED_LOCATION, card) or "Unknown"
             
             # Extract salary if available
-            salary_elem = card.find('span', class_='salaryText')
-            salary_text = salary_elem.get_text(strip=True) if salary_elem else ""
-            salary_min, salary_max = extract_salary(salary_text)
+            salary_min, salary_max = _extract_salary(_xpath_text(_XP_INDEED_SALARY, card))
             
             # Extract job URL
-            link_elem = title_elem.find('a') if title_elem else None
-            job_url = link_elem.get('href') if link_elem else ""
+            hrefs = _XP_INDEED_HREF(card)
+            job_url = str(hrefs[0]) if hrefs else ""
             if job_url and not job_url.startswith('http'):
                 job_url = f"https://www.indeed.com{job_url}"
             
             # Generate external ID
-            external_id = f"indeed_{hash(f'{title}_{company}_{location}')}"
+            external_id = _ext_id('indeed', title, company, location)
             
             return {
                 'external_id': external_id,
-                'title': clean_text(title),
-                'company': clean_text(company),
-                'location': clean_text(location),
+                'title': _clean(title),
+                'company': _clean(company),
+                'location': _clean(location),
                 'salary_min': salary_min,
                 'salary_max': salary_max,
                 'apply_url': job_url,
@@ -319,76 +588,73 @@ class ScraperAgent:
             logger.warning(f"Error extracting Indeed job data: {e}")
             return None
     
-    async def _scrape_internshala(self, search_params: Dict) -> List[Dict]:
+    async def _scrape_internshala(self, search_params: Dict) -> AsyncIterator[Dict]:
         """Scrape jobs from Internshala"""
-        jobs = []
+        page = None
         
         try:
-            if not self.page:
-                self.page = await self.browser.new_page()
-            
-            # Build Internshala search URL
-            keywords = search_params.get('keywords', '')
-            location = search_params.get('location', '')
-            
-            url = f"https://internshala.com/jobs/{keywords.replace(' ', '-')}-jobs"
-            if location:
-                url += f"-in-{location.replace(' ', '-').replace(',', '')}"
-            
-            await self.page.goto(url, wait_until='networkidle')
-            await wait_random_delay(2, 4)
-            
-            # Extract job cards
-            job_cards = await self.page.query_selector_all('.individual_internship')
+            async with self.browser_semaphore:
+                page = await self._get_page('internshala')
+                
+                # Build Internshala search URL
+                keywords = search_params.get('keywords', '')
+                location = search_params.get('location', '')
+                
+                url = f"https://internshala.com/jobs/{keywords.replace(' ', '-')}-jobs"
+                if location:
+                    url += f"-in-{location.replace(' ', '-').replace(',', '')}"
+                
+                await self._fetch_with_backoff(
+                    'internshala', lambda: page.goto(url, wait_until='domcontentloaded')
+                )
+                if not await self._wait_for_cards(page, '.individual_internship'):
+                    logger.info("No Internshala job cards found")
+                    return
+                
+                # Extract job cards (limit to 15 jobs)
+                job_cards = await page.evaluate(
+                    EXTRACT_CARDS_JS, ['.individual_internship', 15, INTERNSHALA_CARD_FIELDS]
+                )
             
-            for card in job_cards[:15]:  # Limit to 15 jobs
+            for card in job_cards:
                 try:
-                    job_data = await self._extract_internshala_job(card)
+                    job_data = self._extract_internshala_job(card)
                     if job_data:
-                        jobs.append(job_data)
+                        yield job_data
                 except Exception as e:
                     logger.warning(f"Error extracting Internshala job: {e}")
                     continue
             
         except Exception as e:
             logger.error(f"Internshala scraping error: {e}")
-        
-        return jobs
+        finally:
+            if page:
+                await page.close()
     
-    async def _extract_internshala_job(self, card) -> Optional[Dict]:
-        """Extract job data from Internshala job card"""
+    def _extract_internshala_job(self, card: Dict) -> Optional[Dict]:
+        """Extract job data from Internshala job card fields read in the page"""
         try:
-            # Extract title
-            title_elem = await card.query_selector('.job-title')
-            title = await title_elem.inner_text() if title_elem else "Unknown"
-            
-            # Extract company
-            company_elem = await card.query_selector('.company-name')
-            company = await company_elem.inner_text() if company_elem else "Unknown"
-            
-            # Extract location
-            location_elem = await card.query_selector('.location-names')
-            location = await location_elem.inner_text() if location_elem else "Unknown"
+            # Extract title, company and location
+            title = card.get('title') or "Unknown"
+            company = card.get('company') or "Unknown"
+            location = card.get('location') or "Unknown"
             
             # Extract salary
-            salary_elem = await card.query_selector('.salary')
-            salary_text = await salary_elem.inner_text() if salary_elem else ""
-            salary_min, salary_max = extract_salary(salary_text)
+            salary_min, salary_max = _extract_salary(card.get('salary') or "")
             
             # Extract job URL
-            link_elem = await card.query_selector('a')
-            job_url = await link_elem.get_attribute('href') if link_elem else ""
+            job_url = card.get('url') or ""
             if job_url and not job_url.startswith('http'):
                 job_url = f"https://internshala.com{job_url}"
             
             # Generate external ID
-            external_id = f"internshala_{hash(f'{title}_{company}_{location}')}"
+            external_id = _ext_id('internshala', title, company, location)
             
             return {
                 'external_id': external_id,
-                'title': clean_text(title),
-                'company': clean_text(company),
-                'location': clean_text(location),
+                'title': _clean(title),
+                'company': _clean(company),
+                'location': _clean(location),
                 'salary_min': salary_min,
                 'salary_max': salary_max,
                 'apply_url': job_url,
@@ -408,7 +674,7 @@ class ScraperAgent:
         unique_jobs = []
         
         for job in jobs:
-            key = f"{job.get('title', '').lower()}_{job.get('company', '').lower()}"
+            key = _job_key(job)
             if key not in seen:
                 seen.add(key)
                 unique_jobs.append(job)
@@ -419,7 +685,7 @@ class ScraperAgent:
         """Create a scraping log entry"""
         # This would integrate with the database to create a log entry
         # For now, return a dummy ID
-        return hash(f"{source}_{datetime.utcnow()}")
+        return int(blake2b(f"{source}_{datetime.utcnow()}".encode(), digest_size=6).hexdigest(), 16)
     
     async def _update_scraping_log(self, log_id: int, jobs_found: int, 
                                  status: str, error_message: str = None):
@@ -1,23 +1,245 @@
 """
 Simple Scraper Agent - Windows Compatible Version
-Uses requests + BeautifulSoup instead of Playwright for better compatibility
+Uses aiohttp + selectolax (Lexbor) instead of Playwright for better compatibility
 """
 
-import requests
 import asyncio
+import json
 import logging
-from typing import Dict, List, Optional
-from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
+import os
 import re
+import string
+import sys
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, parse_qs
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
 import time
-from dataclasses import dataclass
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_right
+from dataclasses import InitVar, dataclass, field, fields
+from hashlib import blake2b
+
+# Optional Aho-Corasick automaton for finding every skill in a single pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Optional MinHash LSH for catching the same job reposted with slightly different wording
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
+    MinHash = MinHashLSH = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Dataclasses can only generate __slots__ on Python 3.10+; older versions use _add_slots
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Listing pages are read in chunks and cut off past this size; the parsers only
+# read the first few job containers, which come early in the document
+MAX_PAGE_BYTES = 4 * 1024 * 1024
+PAGE_CHUNK_SIZE = 16384
+
+# Worker processes that parse fetched pages off the event loop, shared by every scraper in the process
+PARSE_WORKERS = min(4, os.cpu_count() or 1)
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+# Politeness per host: concurrent requests, and exponential backoff when a site throttles us
+HOST_CONCURRENCY = 2
+RETRY_STATUSES = frozenset({429, 503})
+MAX_FETCH_ATTEMPTS = 3
+INITIAL_BACKOFF = 2.0  # seconds, doubled after every throttled attempt
+MAX_BACKOFF = 30.0
+
+# Number of search pages whose validators and parsed jobs are kept for conditional requests
+PAGE_CACHE_SIZE = 256
+
+# Listing pages smaller than this are "no results" or bot-check templates, never real results
+MIN_LISTING_PAGE_BYTES = 2048
+
+# Where fingerprints of pages that parsed to no jobs are saved between runs, and how many are kept
+EMPTY_PAGES_PATH = os.getenv("SIMPLE_SCRAPER_EMPTY_PAGES_PATH", "simple_scraper_empty_pages.json")
+MAX_EMPTY_PAGES = 4096
+
+# Bump when a site parser changes what it finds in a page; together with the field
+# selectors it versions the saved empty-page fingerprints
+PARSER_VERSION = 1
+
+# Jobs with the same title whose title + description 3-gram sets are at least this similar are treated as one
+NEAR_DUPLICATE_THRESHOLD = 0.85
+MINHASH_PERMUTATIONS = 64
+
+# Skills recognised in job text
+_SKILLS = (
+    'python', 'java', 'javascript', 'react', 'node.js', 'angular', 'vue.js',
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes',
+    'git', 'jenkins', 'ci/cd', 'devops',
+    'machine learning', 'data science', 'ai', 'tensorflow', 'pytorch',
+    'html', 'css', 'bootstrap', 'tailwind',
+    'django', 'flask', 'fastapi', 'express.js',
+    'php', 'laravel', 'symfony',
+    'c++', 'c#', 'go', 'rust', 'scala'
+)
+
+# All skills in one pattern, compiled once. Longest alternatives come first and
+# matches must not touch other word characters, so "javascript" is not also
+# "java" and "go" is not found inside "google"
+_SKILL_PATTERN = re.compile(
+    r'(?<!\w)(' + '|'.join(map(re.escape, sorted(_SKILLS, key=len, reverse=True))) + r')(?!\w)',
+    re.IGNORECASE
+)
+
+
+def _build_skill_automaton():
+    """Aho-Corasick automaton over the lowercase skills, each mapped to itself"""
+    automaton = ahocorasick.Automaton()
+    for skill in _SKILLS:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_AUTOMATON = _build_skill_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def _find_fields(container, fields: Dict[str, str]) -> Dict:
+    """First descendant of `container` matching each field's selector, found in one subtree walk"""
+    found = {}
+    for node in container.css(', '.join(fields.values())):
+        # Lexbor also tests the container itself, which bs4's find() never did
+        if node.mem_id == container.mem_id:
+            continue
+        for name, selector in fields.items():
+            if name not in found and node.css_matches(selector):
+                found[name] = node
+        if len(found) == len(fields):
+            break
+    return found
+
+
+# Field selectors per site; within a field, the first element in document order wins
+_WEWORKREMOTELY_FIELDS = {
+    'title': 'span.title',
+    'company': 'span.company',
+}
+
+_JOBSDB_FIELDS = {
+    'title': 'h3.job-title, h3.title, a.job-title, a.title',
+    'company': 'span.company, span.employer, div.company, div.employer',
+    'location': 'span.location, span.city, div.location, div.city',
+}
+
+_GLASSDOOR_FIELDS = {
+    'title': 'a.jobTitle, a.job-title',
+    'company': 'span.employer, span.company',
+    'location': 'span.location, span.loc',
+}
+
+_ANGEL_FIELDS = {
+    'title': 'h3.title, h3.job-title, a.title, a.job-title',
+    'company': 'div.company, div.startup, span.company, span.startup',
+    'link': 'a[href]',
+}
+
+_FLEXJOBS_FIELDS = {
+    'title': 'h3.title, h3.job, h4.title, h4.job, a.title, a.job',
+    'company': 'span.company, span.employer, div.company, div.employer',
+    'link': 'a[href]',
+}
+
+_WORKINGNOMADS_FIELDS = {
+    'title': 'h3, h4, a',
+    'company': 'span.company, div.company',
+    'link': 'a[href]',
+}
+
+
+# Saved fingerprints are only trusted by the parsers that found no jobs in those pages, so
+# a fixed parser or selector gets to parse them again
+_EMPTY_PAGES_VERSION = blake2b(repr((
+    PARSER_VERSION, _WEWORKREMOTELY_FIELDS, _JOBSDB_FIELDS, _GLASSDOOR_FIELDS,
+    _ANGEL_FIELDS, _FLEXJOBS_FIELDS, _WORKINGNOMADS_FIELDS
+)).encode(), digest_size=8).hexdigest()
+
+
+# Lowercases ASCII letters and turns spaces into hyphens in a single translate() pass
+_SLUG_TABLE = str.maketrans(string.ascii_uppercase + ' ', string.ascii_lowercase + '-')
+
+
+def _slug(text: str) -> str:
+    """Lowercase text with spaces replaced by hyphens, for search and job URLs"""
+    if text.isascii():
+        return text.translate(_SLUG_TABLE)
+    return text.lower().replace(' ', '-')
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether a character is a word character (letter, digit or underscore)"""
+    return char.isalnum() or char == '_'
+
+
+def _find_skills(text: str) -> List[str]:
+    """Skills mentioned in a job text, in order of first appearance"""
+    return _find_skills_bulk([text])[0]
+
+
+def _find_skills_bulk(texts: List[str]) -> List[List[str]]:
+    """Skills mentioned in each of several texts, found in one automaton pass over all of them"""
+    if _SKILL_AUTOMATON is None:
+        # One regex scan per text; dict.fromkeys drops repeats in order of appearance
+        return [list(dict.fromkeys(match.lower() for match in _SKILL_PATTERN.findall(text))) for text in texts]
+    
+    # Texts are joined with newlines, which no skill contains and which are not word
+    # characters, so no match spans two texts. Each text is lowered on its own since
+    # lower() can change its length
+    lowered = [text.lower() for text in texts]
+    corpus = '\n'.join(lowered)
+    starts = [0]
+    for text in lowered[:-1]:
+        starts.append(starts[-1] + len(text) + 1)
+    
+    # One automaton pass reports every keyword hit; keep those that stand alone as words
+    found = [{} for _ in texts]
+    for end, skill in _SKILL_AUTOMATON.iter(corpus):
+        start = end - len(skill) + 1
+        if start > 0 and _is_word_char(corpus[start - 1]):
+            continue
+        if end + 1 < len(corpus) and _is_word_char(corpus[end + 1]):
+            continue
+        found[bisect_right(starts, start) - 1].setdefault(skill, None)
+    
+    return [list(skills) for skills in found]
+
+
+def _add_slots(cls):
+    """Rebuild a dataclass with __slots__ for its fields, as dataclass(slots=True) does on 3.10+"""
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict['__slots__'] = field_names
+    for name in field_names + ('__dict__', '__weakref__'):
+        # Field defaults live in the generated __init__; as class attributes they would clash with the slots
+        cls_dict.pop(name, None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@dataclass(frozen=True, eq=False, **_DATACLASS_SLOTS)
 class JobListing:
-    """Data class for job listings"""
+    """Data class for job listings; equal and hashed by normalized title and company"""
     title: str
     company: str
     location: str
@@ -27,7 +249,116 @@ class JobListing:
     date_posted: Optional[str] = None
     job_type: Optional[str] = None
     experience: Optional[str] = None
-    skills: Optional[List[str]] = None
+    skills: InitVar[Optional[List[str]]] = None
+    dedup_key: Tuple[str, str] = field(init=False, repr=False)
+    _skills: Optional[List[str]] = field(init=False, repr=False, default=None)
+    
+    def __post_init__(self, skills):
+        # Skills not given up front are found in the description when first read
+        object.__setattr__(self, '_skills', skills)
+        
+        # Companies, locations and fallback values repeat across listings and cached
+        # pages; interning keeps one copy of each and lets key lookups match by identity
+        for name in ('title', 'company', 'location', 'job_type', 'experience'):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, sys.intern(value))
+        object.__setattr__(self, 'dedup_key', (
+            sys.intern(self.title.lower().strip()), sys.intern(self.company.lower().strip())
+        ))
+    
+    def __reduce__(self):
+        # Rebuild through __init__, so jobs returned by the parse workers are interned
+        # in the receiving process too
+        return (JobListing, tuple(getattr(self, f.name) for f in fields(self) if f.init) + (self._skills,))
+    
+    def __eq__(self, other):
+        if not isinstance(other, JobListing):
+            return NotImplemented
+        return self.dedup_key == other.dedup_key
+    
+    def __hash__(self):
+        return hash(self.dedup_key)
+    
+    @classmethod
+    def extract_skills_bulk(cls, jobs: List['JobListing']):
+        """Fill in the skills of every job not yet scanned, with one pass over all descriptions"""
+        pending = [job for job in jobs if job._skills is None]
+        for job, skills in zip(pending, _find_skills_bulk([job.description for job in pending])):
+            object.__setattr__(job, '_skills', skills)
+
+
+if not _DATACLASS_SLOTS:
+    JobListing = _add_slots(JobListing)
+
+
+def _job_skills(job: JobListing) -> List[str]:
+    """Skills given when the job was built, else those found in its description"""
+    if job._skills is None:
+        object.__setattr__(job, '_skills', _find_skills(job.description))
+    return job._skills
+
+
+# Defined after the class: a property in the class body would become the default of
+# the `skills` init argument
+JobListing.skills = property(_job_skills)
+
+@dataclass
+class CachedPage:
+    """Validators, body digest and parsed jobs from the last fetch of a search page"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    digest: bytes
+    jobs: List[JobListing]
+
+def _has_own_description(job: JobListing) -> bool:
+    """Whether a job's description came with the listing rather than a parser's "... at {company}: {title}" fallback"""
+    return bool(job.description) and not job.description.endswith(f" at {job.company}: {job.title}")
+
+
+class _JobDeduplicator:
+    """Duplicate filter that jobs are fed through in batches: exact (title, company) keys, then near-duplicates"""
+    
+    def __init__(self):
+        self._seen_keys = set()
+        self._lsh = MinHashLSH(threshold=NEAR_DUPLICATE_THRESHOLD, num_perm=MINHASH_PERMUTATIONS) if DATASKETCH_AVAILABLE else None
+        # Normalized title of each job inserted into the LSH index, by index key
+        self._kept_titles: List[str] = []
+    
+    def filter(self, jobs: List[JobListing], limit: Optional[int] = None) -> List[JobListing]:
+        """The jobs not seen in this or an earlier batch, at most `limit` of them"""
+        # Jobs compare by their normalized (title, company) key, so dict.fromkeys
+        # keeps the first job for each key, in order
+        candidates = [job for job in dict.fromkeys(jobs) if job.dedup_key not in self._seen_keys]
+        self._seen_keys.update(job.dedup_key for job in candidates)
+        if self._lsh is None:
+            return candidates[:limit]
+        
+        # Drop jobs with the same normalized title whose title and description nearly
+        # match an earlier job's (MinHash LSH). Made-up fallback descriptions are mostly
+        # the same template, so only jobs with a description of their own are compared.
+        # The generator sets up the hash permutations once per batch, and is only
+        # advanced until `limit` unique jobs are found
+        unique_jobs = []
+        described = [_has_own_description(job) for job in candidates]
+        minhashes = MinHash.generator(
+            (_shingles(f"{job.title} {job.description}".lower())
+             for job, has_description in zip(candidates, described) if has_description),
+            num_perm=MINHASH_PERMUTATIONS
+        )
+        for job, has_description in zip(candidates, described):
+            if len(unique_jobs) == limit:
+                break
+            if has_description:
+                minhash = next(minhashes)
+                title = job.dedup_key[0]
+                if any(self._kept_titles[key] == title for key in self._lsh.query(minhash)):
+                    continue
+                self._lsh.insert(len(self._kept_titles), minhash)
+                self._kept_titles.append(title)
+            unique_jobs.append(job)
+        
+        return unique_jobs
 
 class SimpleScraperAgent:
     """
@@ -37,6 +368,18 @@ class SimpleScraperAgent:
     
     def __init__(self):
         self.session = None
+        # Only a session created by initialize() is closed here; an injected one belongs to the caller
+        self._owns_session = False
+        
+        # Per-host request limits, and the monotonic time until which a throttled host is left alone
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(HOST_CONCURRENCY))
+        self._host_cooldowns: Dict[str, float] = {}
+        
+        # (url, params) -> CachedPage, least recently used first
+        self._page_cache: OrderedDict = OrderedDict()
+        
+        # Digests of bodies that parsed to no jobs, so the same template is never parsed twice
+        self._empty_pages = self._load_empty_pages()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -49,9 +392,11 @@ class SimpleScraperAgent:
         # Job site configurations - using scraping-friendly sites
         self.job_sites = {
             'remoteok': {
-                'base_url': 'https://remoteok.io/remote-{keywords}-jobs',
+                # JSON API serving the same listings as the remote-{tag}-jobs pages
+                'base_url': 'https://remoteok.io/api?tag={keywords}',
                 'search_params': {},
-                'parser': self._parse_remoteok_jobs,
+                'parser': self._parse_remoteok_api,
+                'format': 'json',
                 'enabled': True
             },
             'weworkremotely': {
@@ -138,20 +483,33 @@ class SimpleScraperAgent:
         }
     
     async def initialize(self):
-        """Initialize the scraper agent with requests session"""
+        """Initialize the scraper agent with a pooled aiohttp session"""
         try:
-            # Create requests session
-            self.session = requests.Session()
-            self.session.headers.update(self.headers)
+            # Keep-alive connection pool shared by all concurrent site requests;
+            # resolved hosts are cached so repeat searches skip DNS as well
+            if not self.session or self.session.closed:
+                self.session = aiohttp.ClientSession(
+                    headers=self.headers,
+                    connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30, ttl_dns_cache=300),
+                    timeout=aiohttp.ClientTimeout(total=30)
+                )
+                self._owns_session = True
+            
             logger.info("Simple scraper agent initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize simple scraper agent: {e}")
             raise
     
+    def set_session(self, session: aiohttp.ClientSession):
+        """Use a session owned by the caller, e.g. one pooled across agents; it is not closed on cleanup"""
+        self.session = session
+        self._owns_session = False
+    
     async def cleanup(self):
         """Clean up resources"""
-        if self.session:
-            self.session.close()
+        if self.session and self._owns_session:
+            await self.session.close()
+        self._save_empty_pages()
         logger.info("Simple scraper agent cleaned up")
     
     async def scrape_jobs(self, search_params: Dict) -> List[JobListing]:
@@ -164,10 +522,22 @@ class SimpleScraperAgent:
         Returns:
             List of JobListing objects
         """
+        return [job async for job in self.iter_jobs(search_params)]
+    
+    async def iter_jobs(self, search_params: Dict) -> AsyncIterator[JobListing]:
+        """
+        Scrape jobs from multiple job sites, yielding unique jobs as each site finishes
+        
+        Args:
+            search_params: Dict with 'keywords', 'location', 'job_type', etc.
+        
+        Yields:
+            JobListing objects, up to search_params['max_results']; sites still being
+            fetched once that many are found are cancelled
+        """
         if not self.session:
             await self.initialize()
         
-        all_jobs = []
         keywords = search_params.get('keywords', '')
         location = search_params.get('location', 'India')
         max_results = search_params.get('max_results', 50)
@@ -177,29 +547,46 @@ class SimpleScraperAgent:
         
         logger.info(f"Scraping jobs from {len(enabled_sites)} enabled sites: {list(enabled_sites.keys())}")
         
-        for site_name, site_config in enabled_sites.items():
-            try:
-                logger.info(f"Scraping jobs from {site_name}")
-                jobs = await self._scrape_site(site_name, site_config, keywords, location)
-                all_jobs.extend(jobs)
-                logger.info(f"Found {len(jobs)} jobs from {site_name}")
-                
-                # Add small delay between sites to be respectful
-                await asyncio.sleep(2)
-                
-            except requests.exceptions.HTTPError as e:
-                if e.response and e.response.status_code == 403:
-                    logger.warning(f"Access forbidden (403) for {site_name} - skipping")
-                else:
-                    logger.error(f"HTTP error scraping {site_name}: {e}")
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error scraping {site_name}: {e}")
-                continue
+        # Every site is a different host, so all of them are fetched concurrently
+        tasks = {
+            asyncio.ensure_future(self._scrape_site(site_name, site_config, keywords, location)): site_name
+            for site_name, site_config in enabled_sites.items()
+        }
+        deduplicator = _JobDeduplicator()
+        remaining = max_results
         
-        # Limit results and remove duplicates
-        unique_jobs = self._remove_duplicates(all_jobs)
-        return unique_jobs[:max_results]
+        try:
+            pending = set(tasks)
+            while pending and remaining > 0:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                # Sites finishing together are handled in configuration order
+                for task in sorted(done, key=list(tasks).index):
+                    site_name = tasks[task]
+                    try:
+                        jobs = task.result()
+                    except aiohttp.ClientResponseError as e:
+                        if e.status == 403:
+                            logger.warning(f"Access forbidden (403) for {site_name} - skipping")
+                        else:
+                            logger.error(f"HTTP error scraping {site_name}: {e}")
+                        continue
+                    except Exception as e:
+                        logger.error(f"Unexpected error scraping {site_name}: {e}")
+                        continue
+                    logger.info(f"Found {len(jobs)} jobs from {site_name}")
+                    
+                    # Remove duplicates of this and earlier sites' jobs, and limit results
+                    unique_jobs = deduplicator.filter(jobs, remaining)
+                    JobListing.extract_skills_bulk(unique_jobs)
+                    remaining -= len(unique_jobs)
+                    for job in unique_jobs:
+                        yield job
+                    if remaining <= 0:
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
     
     async def _scrape_site(self, site_name: str, site_config: Dict, keywords: str, location: str) -> List[JobListing]:
         """Scrape jobs from a specific site"""
@@ -207,8 +594,8 @@ class SimpleScraperAgent:
             # Build search URL
             if '{keywords}' in site_config['base_url']:
                 base_url = site_config['base_url'].format(
-                    keywords=keywords.lower().replace(' ', '-'),
-                    location=location.lower().replace(' ', '-')
+                    keywords=_slug(keywords),
+                    location=_slug(location)
                 )
             else:
                 base_url = site_config['base_url']
@@ -223,32 +610,72 @@ class SimpleScraperAgent:
             
             logger.info(f"Making request to {base_url} with params: {params}")
             
-            # Make request with error handling
-            response = self.session.get(base_url, params=params, allow_redirects=True, timeout=30)
+            # Revalidate a previously fetched page instead of downloading it again
+            cache_key = (base_url, tuple(sorted(params.items())))
+            cached = self._page_cache.get(cache_key)
+            request_headers = {}
+            if cached:
+                if cached.etag:
+                    request_headers['If-None-Match'] = cached.etag
+                if cached.last_modified:
+                    request_headers['If-Modified-Since'] = cached.last_modified
             
-            if response.status_code == 403:
+            # Make request with error handling; JSON bodies are read whole since
+            # a truncated document would not decode
+            page_format = site_config.get('format', 'html')
+            max_bytes = MAX_PAGE_BYTES if page_format == 'html' else None
+            status, response_headers, html = await self._fetch(
+                site_name, base_url, params, request_headers, max_bytes
+            )
+            
+            if status == 304 and cached:
+                logger.info(f"{site_name} unchanged since last fetch - reusing {len(cached.jobs)} jobs")
+                self._page_cache.move_to_end(cache_key)
+                return list(cached.jobs)
+            elif status == 403:
                 logger.warning(f"Access forbidden (403) for {site_name} - this site blocks scraping")
                 return []
-            elif response.status_code == 429:
+            elif status == 429:
                 logger.warning(f"Rate limited (429) for {site_name} - too many requests")
                 return []
-            elif response.status_code != 200:
-                logger.warning(f"HTTP {response.status_code} from {site_name}")
+            elif status != 200:
+                logger.warning(f"HTTP {status} from {site_name}")
                 return []
             
-            response.raise_for_status()  # Raise exception for bad status codes
-            html = response.text
-            soup = BeautifulSoup(html, 'html.parser')
+            etag = response_headers.get('ETag')
+            last_modified = response_headers.get('Last-Modified')
+            
+            if page_format == 'html' and len(html) < MIN_LISTING_PAGE_BYTES:
+                logger.info(f"{site_name} returned a {len(html)}-byte page - no listings to parse")
+                return []
+            
+            # A byte-identical body parses to the same jobs
+            digest = blake2b(html, digest_size=16).digest()
+            if digest in self._empty_pages:
+                logger.info(f"{site_name} returned a known empty page - skipping parse")
+                jobs = []
+            elif cached and cached.digest == digest:
+                jobs = list(cached.jobs)
+                logger.info(f"{site_name} returned an unchanged page - reusing {len(jobs)} jobs")
+            else:
+                # Parse jobs using site-specific parser in a worker process
+                parser_name = site_config['parser'].__name__
+                jobs = await asyncio.get_running_loop().run_in_executor(
+                    _get_parse_pool(), _parse_page, parser_name, html, site_name, page_format
+                )
+                logger.info(f"Successfully parsed {len(jobs)} jobs from {site_name}")
+                if not jobs and len(self._empty_pages) < MAX_EMPTY_PAGES:
+                    self._empty_pages.add(digest)
             
-            # Parse jobs using site-specific parser
-            parser = site_config['parser']
-            jobs = parser(soup, site_name)
+            self._page_cache[cache_key] = CachedPage(etag, last_modified, digest, list(jobs))
+            self._page_cache.move_to_end(cache_key)
+            if len(self._page_cache) > PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
             
-            logger.info(f"Successfully parsed {len(jobs)} jobs from {site_name}")
             return jobs
                 
-        except requests.exceptions.HTTPError as e:
-            if e.response and e.response.status_code == 403:
+        except aiohttp.ClientResponseError as e:
+            if e.status == 403:
                 logger.warning(f"Site {site_name} returned 403 Forbidden - disabling this source")
             else:
                 logger.error(f"HTTP error for {site_name}: {e}")
@@ -257,91 +684,119 @@ class SimpleScraperAgent:
             logger.error(f"Error scraping {site_name}: {e}")
             return []
     
-    def _parse_indeed_jobs(self, soup: BeautifulSoup, site_name: str) -> List[JobListing]:
+    async def _fetch(self, site_name: str, url: str, params: Dict, headers: Dict,
+                     max_bytes: Optional[int] = MAX_PAGE_BYTES) -> Tuple[int, Dict, bytes]:
+        """GET a page under its host's concurrency limit, backing off on 429/503; returns (status, headers, body)"""
+        host = urlparse(url).netloc
+        backoff = INITIAL_BACKOFF
+        
+        for attempt in range(1, MAX_FETCH_ATTEMPTS + 1):
+            # Sit out a cooldown set by any earlier throttled request to this host
+            delay = self._host_cooldowns.get(host, 0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            async with self._host_semaphores[host]:
+                async with self.session.get(url, params=params, headers=headers, allow_redirects=True) as response:
+                    status = response.status
+                    if status not in RETRY_STATUSES or attempt == MAX_FETCH_ATTEMPTS:
+                        body = await self._read_page(response, site_name, max_bytes) if status == 200 else b''
+                        return status, response.headers, body
+                    retry_after = response.headers.get('Retry-After', '')
+            
+            # Honour Retry-After when the site sends seconds, otherwise back off exponentially
+            wait = max(backoff, float(retry_after)) if retry_after.isdigit() else backoff
+            wait = min(wait, MAX_BACKOFF)
+            logger.warning(f"{site_name} responded {status}, retrying in {wait:.0f}s")
+            self._host_cooldowns[host] = max(self._host_cooldowns.get(host, 0), time.monotonic() + wait)
+            backoff = min(backoff * 2, MAX_BACKOFF)
+    
+    async def _read_page(self, response: aiohttp.ClientResponse, site_name: str,
+                         max_bytes: Optional[int] = MAX_PAGE_BYTES) -> bytes:
+        """Read a response body chunk by chunk, stopping once it reaches max_bytes (None reads it all)"""
+        if max_bytes is None:
+            return await response.read()
+        
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(PAGE_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                logger.info(f"{site_name} page exceeds {max_bytes} bytes - parsing the first part only")
+                break
+        return b''.join(chunks)[:max_bytes]
+    
+    def _load_empty_pages(self) -> set:
+        """Load the empty-page fingerprints saved by a previous run of the same parsers"""
+        if os.path.exists(EMPTY_PAGES_PATH):
+            try:
+                with open(EMPTY_PAGES_PATH, 'rb') as f:
+                    saved = _loads_json(f.read())
+                if isinstance(saved, dict) and saved.get('version') == _EMPTY_PAGES_VERSION:
+                    return {bytes.fromhex(h) for h in saved['pages'][:MAX_EMPTY_PAGES]}
+                logger.info("Discarding empty-page fingerprints saved by other parsers")
+            except Exception as e:
+                logger.warning(f"Could not load empty-page fingerprints: {e}")
+        return set()
+    
+    def _save_empty_pages(self):
+        """Persist the empty-page fingerprints so they survive restarts"""
+        try:
+            with open(EMPTY_PAGES_PATH, 'w') as f:
+                json.dump({
+                    'version': _EMPTY_PAGES_VERSION,
+                    'pages': [digest.hex() for digest in self._empty_pages]
+                }, f)
+        except Exception as e:
+            logger.warning(f"Could not save empty-page fingerprints: {e}")
+    
+    @staticmethod
+    def _parse_indeed_jobs(tree: LexborHTMLParser, site_name: str) -> List[JobListing]:
         """Parse job listings from Indeed (disabled but kept for reference)"""
         return []  # Disabled due to 403 errors
     
-    def _parse_remoteok_jobs(self, soup: BeautifulSoup, site_name: str) -> List[JobListing]:
-        """Parse job listings from RemoteOK"""
+    @staticmethod
+    def _parse_remoteok_api(data: bytes, site_name: str) -> List[JobListing]:
+        """Parse job listings from the RemoteOK JSON API"""
         jobs = []
         
         try:
-            # RemoteOK job containers
-            job_containers = soup.find_all(['tr'], class_='job')
+            # The first element is the API's legal notice, not a job
+            rows = _loads_json(data)[1:]
             
-            for container in job_containers[:10]:  # Limit to 10 jobs per site
+            for row in rows[:10]:  # Limit to 10 jobs per site
                 try:
-                    # Extract job ID for URL construction
-                    job_id = container.get('data-id') or container.get('id', '')
-                    
-                    # Extract job details with multiple selector attempts
-                    title_elem = (container.find(['h2']) or 
-                                container.find(['a'], class_='preventLink') or
-                                container.find(['td'], class_='company position company_and_position'))
-                    
-                    company_elem = (container.find(['h3']) or 
-                                  container.find(['td'], class_='company') or
-                                  container.find(['span'], class_='company'))
-                    
-                    location_elem = (container.find(['div'], class_='location') or
-                                   container.find(['td'], class_='location'))
-                    
-                    # Try to extract actual job URL from links
-                    link_elem = container.find('a', href=True)
-                    job_url = "https://remoteok.io"
-                    if link_elem and link_elem.get('href'):
-                        href = link_elem['href']
-                        if href.startswith('/'):
-                            job_url = f"https://remoteok.io{href}"
-                        elif href.startswith('http'):
-                            job_url = href
-                    elif job_id:
-                        job_url = f"https://remoteok.io/remote-jobs/{job_id}"
-                    
-                    # Get job title with fallback
-                    title = "Remote Job Opportunity"
-                    if title_elem:
-                        title_text = title_elem.get_text(strip=True)
-                        if title_text and len(title_text) > 2:
-                            title = title_text
-                    
-                    # Get company with fallback
-                    company = "Remote Company"
-                    if company_elem:
-                        company_text = company_elem.get_text(strip=True)
-                        if company_text and len(company_text) > 1:
-                            company = company_text
-                    
-                    # Get location with fallback
-                    location = "Remote"
-                    if location_elem:
-                        location_text = location_elem.get_text(strip=True)
-                        if location_text:
-                            location = location_text
-                    
-                    # Extract description from multiple possible sources
-                    desc_elem = (container.find(['div'], class_='description') or
-                               container.find(['td'], class_='tags') or
-                               container.find(['span'], class_='tags'))
+                    title = row.get('position') or "Remote Job Opportunity"
+                    company = row.get('company') or "Remote Company"
                     
+                    # Descriptions come as HTML; keep a short plain-text summary
                     description = f"Remote position at {company}: {title}"
-                    if desc_elem:
-                        desc_text = desc_elem.get_text(strip=True)
+                    if row.get('description'):
+                        desc_text = LexborHTMLParser(row['description']).text(separator=' ', strip=True)
                         if desc_text:
                             description = desc_text[:200] + "..." if len(desc_text) > 200 else desc_text
                     
-                    # Create job listing with real URL
+                    salary = None
+                    if row.get('salary_min') and row.get('salary_max'):
+                        salary = f"${row['salary_min']:,} - ${row['salary_max']:,}"
+                    
+                    job_url = row.get('url') or f"https://remoteok.io/remote-jobs/{row.get('id', '')}"
+                    
                     job = JobListing(
                         title=title,
                         company=company,
-                        location=location,
+                        location=row.get('location') or "Remote",
                         description=description,
                         url=job_url,
+                        salary=salary,
+                        date_posted=row.get('date'),
                         job_type="Remote",
-                        experience="Not specified"
+                        experience="Not specified",
+                        skills=row.get('tags') or None
                     )
                     jobs.append(job)
-                        
+                    
                 except Exception as e:
                     logger.warning(f"Error parsing job from {site_name}: {e}")
                     continue
@@ -351,29 +806,31 @@ class SimpleScraperAgent:
             
         return jobs
     
-    def _parse_weworkremotely_jobs(self, soup: BeautifulSoup, site_name: str) -> List[JobListing]:
+    @staticmethod
+    def _parse_weworkremotely_jobs(tree: LexborHTMLParser, site_name: str) -> List[JobListing]:
         """Parse job listings from WeWorkRemotely"""
         jobs = []
         
         try:
             # WeWorkRemotely job containers
-            job_containers = soup.find_all(['li'], class_=re.compile('feature|jobs'))
+            job_containers = tree.css('li.feature, li.jobs')
             
             for container in job_containers[:10]:
                 try:
-                    title_elem = container.find(['span'], class_='title')
-                    company_elem = container.find(['span'], class_='company')
+                    fields = _find_fields(container, _WEWORKREMOTELY_FIELDS)
+                    title_elem = fields.get('title')
+                    company_elem = fields.get('company')
                     
                     if title_elem and company_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True)
+                        title = title_elem.text(strip=True)
+                        company = company_elem.text(strip=True)
                         
                         job = JobListing(
                             title=title,
                             company=company,
                             location="Remote",
                             description=f"Remote job at {company}: {title}",
-                            url=f"https://weworkremotely.com/remote-jobs/{title.lower().replace(' ', '-')}",
+                            url=f"https://weworkremotely.com/remote-jobs/{_slug(title)}",
                             job_type="Remote",
                             experience="Not specified"
                         )
@@ -388,31 +845,33 @@ class SimpleScraperAgent:
             
         return jobs
     
-    def _parse_jobsdb_jobs(self, soup: BeautifulSoup, site_name: str) -> List[JobListing]:
+    @staticmethod
+    def _parse_jobsdb_jobs(tree: LexborHTMLParser, site_name: str) -> List[JobListing]:
         """Parse job listings from JobsDB"""
         jobs = []
         
         try:
             # JobsDB job containers
-            job_containers = soup.find_all(['div'], class_=re.compile('job-item|position'))
+            job_containers = tree.css('div.job-item, div.position')
             
             for container in job_containers[:10]:
                 try:
-                    title_elem = container.find(['h3', 'a'], class_=re.compile('job-title|title'))
-                    company_elem = container.find(['span', 'div'], class_=re.compile('company|employer'))
-                    location_elem = container.find(['span', 'div'], class_=re.compile('location|city'))
+                    fields = _find_fields(container, _JOBSDB_FIELDS)
+                    title_elem = fields.get('title')
+                    company_elem = fields.get('company')
+                    location_elem = fields.get('location')
                     
                     if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True) if company_elem else "Company"
-                        location = location_elem.get_text(strip=True) if location_elem else "Location not specified"
+                        title = title_elem.text(strip=True)
+                        company = company_elem.text(strip=True) if company_elem else "Company"
+                        location = location_elem.text(strip=True) if location_elem else "Location not specified"
                         
                         job = JobListing(
                             title=title,
                             company=company,
                             location=location,
                             description=f"Job opportunity at {company}: {title}",
-                            url=f"https://www.jobsdb.com/job/{title.lower().replace(' ', '-')}",
+                            url=f"https://www.jobsdb.com/job/{_slug(title)}",
                             job_type="Full-time",
                             experience="Not specified"
                         )
@@ -427,31 +886,33 @@ class SimpleScraperAgent:
             
         return jobs
     
-    def _parse_glassdoor_jobs(self, soup: BeautifulSoup, site_name: str) -> List[JobListing]:
+    @staticmethod
+    def _parse_glassdoor_jobs(tree: LexborHTMLParser, site_name: str) -> List[JobListing]:
         """Parse job listings from Glassdoor"""
         jobs = []
         
         try:
             # Glassdoor job containers
-            job_containers = soup.find_all(['div'], class_=re.compile('job|react-job-listing'))
+            job_containers = tree.css('div.job, div.react-job-listing')
             
             for container in job_containers[:10]:
                 try:
-                    title_elem = container.find(['a'], class_=re.compile('jobTitle|job-title'))
-                    company_elem = container.find(['span'], class_=re.compile('employer|company'))
-                    location_elem = container.find(['span'], class_=re.compile('location|loc'))
+                    fields = _find_fields(container, _GLASSDOOR_FIELDS)
+                    title_elem = fields.get('title')
+                    company_elem = fields.get('company')
+                    location_elem = fields.get('location')
                     
                     if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True) if company_elem else "Company"
-                        location = location_elem.get_text(strip=True) if location_elem else "Location not specified"
+                        title = title_elem.text(strip=True)
+                        company = company_elem.text(strip=True) if company_elem else "Company"
+                        location = location_elem.text(strip=True) if location_elem else "Location not specified"
                         
                         job = JobListing(
                             title=title,
                             company=company,
                             location=location,
                             description=f"Position at {company}: {title}",
-                            url=f"https://www.glassdoor.com/job/{title.lower().replace(' ', '-')}",
+                            url=f"https://www.glassdoor.com/job/{_slug(title)}",
                             job_type="Full-time",
                             experience="Not specified"
                         )
@@ -466,28 +927,30 @@ class SimpleScraperAgent:
             
         return jobs
     
-    def _parse_angel_jobs(self, soup: BeautifulSoup, site_name: str) -> List[JobListing]:
+    @staticmethod
+    def _parse_angel_jobs(tree: LexborHTMLParser, site_name: str) -> List[JobListing]:
         """Parse job listings from Wellfound (AngelList)"""
         jobs = []
         
         try:
             # Wellfound job containers
-            job_containers = soup.find_all(['div'], class_=re.compile('job|startup|listing'))
+            job_containers = tree.css('div.job, div.startup, div.listing')
             
             for container in job_containers[:10]:
                 try:
-                    title_elem = container.find(['h3', 'a'], class_=re.compile('title|job-title'))
-                    company_elem = container.find(['div', 'span'], class_=re.compile('company|startup'))
-                    link_elem = container.find('a', href=True)
+                    fields = _find_fields(container, _ANGEL_FIELDS)
+                    title_elem = fields.get('title')
+                    company_elem = fields.get('company')
+                    link_elem = fields.get('link')
                     
                     if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True) if company_elem else "Startup"
+                        title = title_elem.text(strip=True)
+                        company = company_elem.text(strip=True) if company_elem else "Startup"
                         
                         # Extract real URL if available
                         job_url = "https://wellfound.com"
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
+                        if link_elem and link_elem.attributes.get('href'):
+                            href = link_elem.attributes['href']
                             if href.startswith('/'):
                                 job_url = f"https://wellfound.com{href}"
                             elif href.startswith('http'):
@@ -513,28 +976,30 @@ class SimpleScraperAgent:
             
         return jobs
     
-    def _parse_flexjobs_jobs(self, soup: BeautifulSoup, site_name: str) -> List[JobListing]:
+    @staticmethod
+    def _parse_flexjobs_jobs(tree: LexborHTMLParser, site_name: str) -> List[JobListing]:
         """Parse job listings from FlexJobs"""
         jobs = []
         
         try:
             # FlexJobs job containers
-            job_containers = soup.find_all(['div', 'li'], class_=re.compile('job|listing|position'))
+            job_containers = tree.css('div.job, div.listing, div.position, li.job, li.listing, li.position')
             
             for container in job_containers[:10]:
                 try:
-                    title_elem = container.find(['h3', 'h4', 'a'], class_=re.compile('title|job'))
-                    company_elem = container.find(['span', 'div'], class_=re.compile('company|employer'))
-                    link_elem = container.find('a', href=True)
+                    fields = _find_fields(container, _FLEXJOBS_FIELDS)
+                    title_elem = fields.get('title')
+                    company_elem = fields.get('company')
+                    link_elem = fields.get('link')
                     
                     if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True) if company_elem else "FlexJobs Company"
+                        title = title_elem.text(strip=True)
+                        company = company_elem.text(strip=True) if company_elem else "FlexJobs Company"
                         
                         # Extract real URL if available
                         job_url = "https://www.flexjobs.com"
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
+                        if link_elem and link_elem.attributes.get('href'):
+                            href = link_elem.attributes['href']
                             if href.startswith('/'):
                                 job_url = f"https://www.flexjobs.com{href}"
                             elif href.startswith('http'):
@@ -560,28 +1025,30 @@ class SimpleScraperAgent:
             
         return jobs
     
-    def _parse_workingnomads_jobs(self, soup: BeautifulSoup, site_name: str) -> List[JobListing]:
+    @staticmethod
+    def _parse_workingnomads_jobs(tree: LexborHTMLParser, site_name: str) -> List[JobListing]:
         """Parse job listings from Working Nomads"""
         jobs = []
         
         try:
             # Working Nomads job containers
-            job_containers = soup.find_all(['div', 'li'], class_=re.compile('job|listing'))
+            job_containers = tree.css('div.job, div.listing, li.job, li.listing')
             
             for container in job_containers[:10]:
                 try:
-                    title_elem = container.find(['h3', 'h4', 'a'])
-                    company_elem = container.find(['span', 'div'], class_=re.compile('company'))
-                    link_elem = container.find('a', href=True)
+                    fields = _find_fields(container, _WORKINGNOMADS_FIELDS)
+                    title_elem = fields.get('title')
+                    company_elem = fields.get('company')
+                    link_elem = fields.get('link')
                     
                     if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True) if company_elem else "Remote Company"
+                        title = title_elem.text(strip=True)
+                        company = company_elem.text(strip=True) if company_elem else "Remote Company"
                         
                         # Extract real URL if available
                         job_url = "https://www.workingnomads.co"
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
+                        if link_elem and link_elem.attributes.get('href'):
+                            href = link_elem.attributes['href']
                             if href.startswith('/'):
                                 job_url = f"https://www.workingnomads.co{href}"
                             elif href.startswith('http'):
@@ -607,51 +1074,23 @@ class SimpleScraperAgent:
             
         return jobs
     
-    def _parse_naukri_jobs(self, soup: BeautifulSoup, site_name: str) -> List[JobListing]:
+    @staticmethod
+    def _parse_naukri_jobs(tree: LexborHTMLParser, site_name: str) -> List[JobListing]:
         """Parse job listings from Naukri (disabled)"""
         return []  # Disabled due to 403 errors
     
-    def _parse_linkedin_jobs(self, soup: BeautifulSoup, site_name: str) -> List[JobListing]:
+    @staticmethod
+    def _parse_linkedin_jobs(tree: LexborHTMLParser, site_name: str) -> List[JobListing]:
         """Parse job listings from LinkedIn (disabled)"""
         return []  # Disabled due to 403 errors
     
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills from job text using keyword matching"""
-        skills_keywords = [
-            'python', 'java', 'javascript', 'react', 'node.js', 'angular', 'vue.js',
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes',
-            'git', 'jenkins', 'ci/cd', 'devops',
-            'machine learning', 'data science', 'ai', 'tensorflow', 'pytorch',
-            'html', 'css', 'bootstrap', 'tailwind',
-            'django', 'flask', 'fastapi', 'express.js',
-            'php', 'laravel', 'symfony',
-            'c++', 'c#', 'go', 'rust', 'scala'
-        ]
-        
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in skills_keywords:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        
-        return list(set(found_skills))  # Remove duplicates
+        return _find_skills(text)
     
-    def _remove_duplicates(self, jobs: List[JobListing]) -> List[JobListing]:
-        """Remove duplicate job listings based on title and company"""
-        seen = set()
-        unique_jobs = []
-        
-        for job in jobs:
-            # Create a key based on title and company (normalized)
-            key = f"{job.title.lower().strip()}|{job.company.lower().strip()}"
-            
-            if key not in seen:
-                seen.add(key)
-                unique_jobs.append(job)
-        
-        return unique_jobs
+    def _remove_duplicates(self, jobs: List[JobListing], limit: Optional[int] = None) -> List[JobListing]:
+        """Remove duplicate job listings based on title and company, then near-duplicates, keeping at most `limit`"""
+        return _JobDeduplicator().filter(jobs, limit)
     
     async def test_connection(self) -> bool:
         """Test if the scraper can connect to job sites"""
@@ -661,8 +1100,8 @@ class SimpleScraperAgent:
             
             # Test connection to one of the enabled sites
             test_url = 'https://remoteok.io'
-            response = self.session.get(test_url, timeout=10)
-            success = response.status_code == 200
+            async with self.session.get(test_url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                success = response.status == 200
             logger.info(f"Test connection to {test_url} result: {success}")
             return success
                 
@@ -673,3 +1112,46 @@ class SimpleScraperAgent:
     def is_healthy(self) -> bool:
         """Check if the scraper is healthy"""
         return self.session is not None and not self.session.closed
+
+
+def _shingles(text: str) -> List[bytes]:
+    """Distinct character 3-grams of a text, encoded for MinHash"""
+    return [shingle.encode('utf-8') for shingle in {text[i:i + 3] for i in range(max(len(text) - 2, 1))}]
+
+
+def _loads_json(data: bytes):
+    """Decode a JSON response body, using orjson when installed"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _warm_up_parse_worker():
+    """Run once in each parse worker so it has imported this module and loaded Lexbor"""
+    LexborHTMLParser(b'<html></html>')
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """The process-wide parse pool, started on the first parse"""
+    global _parse_pool
+    if _parse_pool is None:
+        # Page parsing is CPU-bound, so it runs in worker processes in parallel; the
+        # other workers start up and import this module while the first page parses
+        _parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+        for _ in range(PARSE_WORKERS - 1):
+            _parse_pool.submit(_warm_up_parse_worker)
+    return _parse_pool
+
+
+def shutdown_parse_pool():
+    """Stop the shared parse workers, e.g. when the app shuts down"""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False)
+        _parse_pool = None
+
+
+def _parse_page(parser_name: str, body: bytes, site_name: str, page_format: str = 'html') -> List[JobListing]:
+    """Parse a fetched page with the named site parser; module-level so worker processes can run it"""
+    # JSON parsers decode the body themselves; for HTML, Lexbor parses the raw
+    # UTF-8 bytes, and the parsers only need CSS matching and text
+    document = body if page_format == 'json' else LexborHTMLParser(body)
+    return getattr(SimpleScraperAgent, parser_name)(document, site_name)
@@ -5,10 +5,24 @@ Uses the simple scraper instead of Playwright-based scraper
 
 import asyncio
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+import time
+from collections import Counter, OrderedDict, deque
+from functools import lru_cache
+from hashlib import blake2b
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 import json
 
+import aiohttp
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from .simple_scraper_agent import SimpleScraperAgent, JobListing
 from database.db_connection import Database
 from .autoapply_agent import AutoApplyAgent
@@ -16,6 +30,95 @@ from .autoapply_agent import AutoApplyAgent
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct searches whose results are cached, in total and per user
+SEARCH_CACHE_SIZE = 128
+SEARCH_CACHE_SIZE_PER_USER = 32
+
+# Searches scraping at the same time, shared by manual and auto mode
+MAX_CONCURRENT_SEARCHES = 4
+
+# Seconds stop_auto_mode waits for a running auto search before cancelling it
+AUTO_STOP_TIMEOUT = 5
+
+# Seconds get_system_status waits for the health probes
+HEALTH_CHECK_TIMEOUT = 2
+
+# Rolling window, in seconds, over which max_auto_applies_per_day is enforced
+AUTO_APPLY_WINDOW = 24 * 60 * 60
+
+# Scraped jobs are saved to the database in batches of this size while a search runs
+SAVE_BATCH_SIZE = 200
+
+# Keep-alive HTTP connections shared by every search, in total and per host
+HTTP_POOL_SIZE = 64
+HTTP_POOL_SIZE_PER_HOST = 8
+
+
+@lru_cache(maxsize=256)
+def _norm_key(keywords: str, location: str, max_results: str, user_id: Optional[int] = None) -> str:
+    """Normalized search parameters hashed to a fixed-size cache key; repeat searches skip the work"""
+    key_parts = [keywords.lower().strip(), location.lower().strip(), max_results]
+    if user_id is not None:
+        key_parts.append(str(user_id))
+    return blake2b('|'.join(key_parts).encode(), digest_size=16).hexdigest()
+
+
+def _plain_mapping(value):
+    """Encode the read-only job mappings of a cached result as plain objects"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps_result(result: Dict) -> bytes:
+    """Serialize a search result to JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result, default=_plain_mapping)
+    return json.dumps(result, default=_plain_mapping).encode()
+
+
+def _freeze_result(result: Dict) -> Mapping:
+    """Read-only snapshot of a search result for the cache, sharing nothing mutable with it"""
+    return MappingProxyType({
+        **result,
+        'search_params': MappingProxyType(dict(result['search_params'])),
+        'jobs': tuple(MappingProxyType({**job, 'skills': tuple(job['skills'])}) for job in result['jobs'])
+    })
+
+
+def _thaw_result(cached: Mapping) -> Dict:
+    """Copy of a cached search result for one caller; the read-only jobs are shared, not copied"""
+    return {**cached, 'search_params': dict(cached['search_params'])}
+
+
+def _probe_status(healthy: Optional[bool]) -> str:
+    """Status label for a health probe result; None means it timed out"""
+    if healthy is None:
+        return 'timeout'
+    return 'running' if healthy else 'error'
+
+
+def _posted_datetime(date_posted: Optional[str]) -> Optional[datetime]:
+    """Parse a listing's ISO posting date into the naive UTC datetime the jobs table stores"""
+    if not date_posted:
+        return None
+    try:
+        posted = datetime.fromisoformat(date_posted.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if posted.tzinfo:
+        posted = posted.astimezone(timezone.utc).replace(tzinfo=None)
+    return posted
+
+
+def _external_id(job: JobListing) -> str:
+    """Stable ID for a scraped job, the same in every process, so repeat scrapes are not saved twice"""
+    digest = blake2b(digest_size=8)
+    digest.update(job.title.encode())
+    digest.update(b"|")
+    digest.update(job.company.encode())
+    return "remoteok_" + digest.hexdigest()
+
 class SimpleSupervisorAgent:
     """
     A simplified supervisor agent that coordinates job search activities
@@ -30,42 +133,72 @@ class SimpleSupervisorAgent:
         self.scoring_agent = None  # Placeholder
         self.is_auto_mode = False
         self.auto_task = None
+        self._stop_event: Optional[asyncio.Event] = None  # Set to wake and end the auto search loop
+        self._http: Optional[aiohttp.ClientSession] = None  # Pooled session lent to the scraper
         self.last_search_time = None
-        self.search_results_cache = {}
+        # cache key -> (result, monotonic expiry time, user_id), least recently used first
+        # Cached results are read-only snapshots, so no caller can change what later hits return
+        # Searches without a user (anonymous and auto mode) share one partition
+        self.search_results_cache: "OrderedDict[str, Tuple[Mapping, float, Optional[int]]]" = OrderedDict()
+        self._cache_entries_per_user: Counter = Counter()
         self.max_cache_age = timedelta(hours=1)  # Cache results for 1 hour
+        self._search_semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_SEARCHES)
         
         # Auto-apply settings
         self.auto_apply_enabled = False
         self.auto_apply_threshold = 80.0  # Default threshold score
         self.max_auto_applies_per_day = 10
+        self._auto_apply_times: deque = deque()  # Monotonic times of auto-applications, oldest first
     
     async def initialize(self):
         """Initialize the supervisor agent"""
         try:
-            await self.scraper_agent.initialize()
+            # One pooled session for the agent's lifetime, so overlapping manual and auto
+            # searches reuse open TCP/TLS connections instead of each opening their own
+            if not self._http or self._http.closed:
+                self._http = aiohttp.ClientSession(
+                    headers=self.scraper_agent.headers,
+                    connector=aiohttp.TCPConnector(
+                        limit=HTTP_POOL_SIZE, limit_per_host=HTTP_POOL_SIZE_PER_HOST,
+                        ttl_dns_cache=300, keepalive_timeout=30
+                    ),
+                    timeout=aiohttp.ClientTimeout(total=30)
+                )
+            self.scraper_agent.set_session(self._http)
+            
+            # The agents do not depend on each other, so they start up concurrently
+            scraper_result, autoapply_result, scoring_result = await asyncio.gather(
+                self.scraper_agent.initialize(),
+                self.autoapply_agent.initialize(),
+                self.scoring_agent.initialize() if self.scoring_agent else asyncio.sleep(0),
+                return_exceptions=True
+            )
+            if isinstance(scraper_result, BaseException):
+                raise scraper_result
             
-            # Try to initialize auto-apply agent with graceful failure handling
-            try:
-                await self.autoapply_agent.initialize()
-                logger.info("Auto-apply agent initialized successfully")
-            except Exception as e:
-                logger.warning(f"Auto-apply agent initialization failed: {e}")
+            # Auto-apply agent failures are handled gracefully
+            if isinstance(autoapply_result, Exception):
+                logger.warning("Auto-apply agent initialization failed: %s", autoapply_result)
                 logger.info("Continuing without auto-apply functionality")
+            else:
+                logger.info("Auto-apply agent initialized successfully")
             
             # Temporarily disable scoring agent due to PyTorch memory issues
-            try:
-                if self.scoring_agent:
-                    await self.scoring_agent.initialize()
-                    logger.info("Scoring agent initialized successfully")
-                else:
-                    logger.info("Scoring agent disabled - using simplified scoring")
-            except Exception as e:
-                logger.warning(f"Scoring agent initialization failed: {e}")
+            if not self.scoring_agent:
+                logger.info("Scoring agent disabled - using simplified scoring")
+            elif isinstance(scoring_result, Exception):
+                logger.warning("Scoring agent initialization failed: %s", scoring_result)
                 logger.info("Continuing without ML scoring functionality")
+            else:
+                logger.info("Scoring agent initialized successfully")
             
             logger.info("Simple supervisor agent initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize simple supervisor agent: {e}")
+            logger.error("Failed to initialize simple supervisor agent: %s", e)
+            # A supervisor that failed to start is not cleaned up by its caller
+            if self._http:
+                await self._http.close()
+                self._http = None
             raise
     
     async def cleanup(self):
@@ -79,98 +212,105 @@ class SimpleSupervisorAgent:
         if self.autoapply_agent:
             await self.autoapply_agent.cleanup()
         
+        if self._http:
+            await self._http.close()
+            self._http = None
+        
         logger.info("Simple supervisor agent cleaned up")
     
-    async def trigger_job_search(self, search_params: Dict) -> Dict:
+    async def trigger_job_search(self, search_params: Dict, user_id: Optional[int] = None) -> Dict:
         """
         Trigger a manual job search
         
         Args:
             search_params: Dict with search criteria
+            user_id: Optional user the search is for; each user's results are cached separately
         
         Returns:
             Dict with search results and metadata
         """
         try:
-            logger.info(f"Starting job search with params: {search_params}")
+            logger.info("Starting job search with params: %s", search_params)
             
             # Create cache key
-            cache_key = self._create_cache_key(search_params)
+            cache_key = self._create_cache_key(search_params, user_id)
             
             # Check cache first
             if self._is_cache_valid(cache_key):
                 logger.info("Returning cached results")
-                return self.search_results_cache[cache_key]
-            
-            # Perform search
-            start_time = datetime.now()
-            jobs = await self.scraper_agent.scrape_jobs(search_params)
-            search_duration = (datetime.now() - start_time).total_seconds()
-            
-            # Convert JobListing objects to dicts and save to database
+                self.search_results_cache.move_to_end(cache_key)
+                # A top-level copy whose jobs are the cache's read-only tuple, so a hit costs
+                # the same however many jobs it holds and no caller can change them
+                result = _thaw_result(self.search_results_cache[cache_key][0])
+                result['cached_at'] = datetime.now().isoformat()
+                return result
+            
+            # Perform search, converting jobs as the scraper streams them in: the original
+            # job format for the frontend, and database rows saved by a task per batch, which
+            # runs while the scraper waits on the remaining sites (the save itself is synchronous)
             job_dicts = []
-            for job in jobs:
-                job_dict = {
-                    'title': job.title,
-                    'company': job.company,
-                    'location': job.location,
-                    'description': job.description,
-                    'apply_url': job.url,  # Map url to apply_url
-                    'job_type': job.job_type,
-                    'experience_level': job.experience,
-                    'source': 'remoteok',  # Set source
-                    'posted_date': job.date_posted,
-                    'external_id': f"remoteok_{hash(job.title + job.company)}"  # Generate external_id
-                }
-                job_dicts.append(job_dict)
-            
-            # Save jobs to database if any were found
-            saved_jobs = []
-            if job_dicts:
-                try:
-                    saved_jobs = await self.database.save_jobs(job_dicts)
-                    logger.info(f"Saved {len(saved_jobs)} jobs to database")
-                except Exception as e:
-                    logger.error(f"Failed to save jobs to database: {e}")
-            
-            # Prepare response with original job format for frontend
             response_jobs = []
-            for job in jobs:
-                job_dict = {
-                    'title': job.title,
-                    'company': job.company,
-                    'location': job.location,
-                    'description': job.description,
-                    'url': job.url,
-                    'salary': job.salary,
-                    'date_posted': job.date_posted,
-                    'job_type': job.job_type,
-                    'experience': job.experience,
-                    'skills': job.skills or []
-                }
-                response_jobs.append(job_dict)
+            save_tasks = []
+            start_time = time.monotonic()
+            async with self._search_semaphore:
+                async for job in self.scraper_agent.iter_jobs(search_params):
+                    title, company, location, description = job.title, job.company, job.location, job.description
+                    url, date_posted, job_type, experience = job.url, job.date_posted, job.job_type, job.experience
+                    response_jobs.append({
+                        'title': title,
+                        'company': company,
+                        'location': location,
+                        'description': description,
+                        'url': url,
+                        'salary': job.salary,
+                        'date_posted': date_posted,
+                        'job_type': job_type,
+                        'experience': experience,
+                        'skills': job.skills or []
+                    })
+                    job_dicts.append({
+                        'title': title,
+                        'company': company,
+                        'location': location,
+                        'description': description,
+                        'apply_url': url,  # Map url to apply_url
+                        'job_type': job_type,
+                        'experience_level': experience,
+                        'source': 'remoteok',  # Set source
+                        'posted_date': _posted_datetime(date_posted),
+                        'external_id': _external_id(job)  # Generate external_id
+                    })
+                    if len(job_dicts) >= SAVE_BATCH_SIZE:
+                        save_tasks.append(asyncio.create_task(self._persist_jobs(job_dicts)))
+                        job_dicts = []
+            search_duration = time.monotonic() - start_time
+            
+            # Save the last jobs to database, then wait for the earlier batches' saves
+            saved_jobs = await self._persist_jobs(job_dicts)
+            saved_to_db = len(saved_jobs) + sum(len(batch) for batch in await asyncio.gather(*save_tasks))
             
             # Prepare response
+            now = datetime.now()
             result = {
                 'success': True,
                 'search_params': search_params,
                 'jobs': response_jobs,
                 'total_found': len(response_jobs),
-                'saved_to_db': len(saved_jobs),
+                'saved_to_db': saved_to_db,
                 'search_duration_seconds': search_duration,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now.isoformat(),
                 'cache_key': cache_key
             }
             
             # Cache the results
-            self.search_results_cache[cache_key] = result
-            self.last_search_time = datetime.now()
+            self._cache_result(cache_key, result, user_id)
+            self.last_search_time = now
             
-            logger.info(f"Job search completed: found {len(job_dicts)} jobs in {search_duration:.2f}s")
+            logger.info("Job search completed: found %s jobs in %.2fs", len(response_jobs), search_duration)
             return result
             
         except Exception as e:
-            logger.error(f"Job search failed: {e}")
+            logger.error("Job search failed: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -178,6 +318,22 @@ class SimpleSupervisorAgent:
                 'timestamp': datetime.now().isoformat()
             }
     
+    async def trigger_job_search_json(self, search_params: Dict, user_id: Optional[int] = None) -> bytes:
+        """Trigger a manual job search and return its result already encoded as JSON"""
+        return _dumps_result(await self.trigger_job_search(search_params, user_id))
+    
+    async def _persist_jobs(self, job_dicts: List[Dict]) -> List:
+        """Save jobs to the database if any were found; a failed save is logged and returns no jobs"""
+        if not job_dicts:
+            return []
+        try:
+            saved_jobs = await self.database.save_jobs(job_dicts)
+            logger.info("Saved %s jobs to database", len(saved_jobs))
+            return saved_jobs
+        except Exception as e:
+            logger.error("Failed to save jobs to database: %s", e)
+            return []
+    
     async def start_auto_mode(self, search_params: Optional[Dict] = None) -> Dict:
         """
         Start automated job search mode
@@ -205,6 +361,8 @@ class SimpleSupervisorAgent:
                 }
             
             self.is_auto_mode = True
+            # Created here so it belongs to the running event loop
+            self._stop_event = asyncio.Event()
             self.auto_task = asyncio.create_task(
                 self._auto_search_loop(search_params)
             )
@@ -218,7 +376,7 @@ class SimpleSupervisorAgent:
             }
             
         except Exception as e:
-            logger.error(f"Failed to start auto mode: {e}")
+            logger.error("Failed to start auto mode: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -243,11 +401,13 @@ class SimpleSupervisorAgent:
             self.is_auto_mode = False
             
             if self.auto_task:
-                self.auto_task.cancel()
-                try:
-                    await self.auto_task
-                except asyncio.CancelledError:
-                    pass
+                self._stop_event.set()
+                if not self.auto_task.done():
+                    try:
+                        # A search still in progress gets a few seconds to finish, then is cancelled
+                        await asyncio.wait_for(self.auto_task, timeout=AUTO_STOP_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        logger.warning("Auto search did not finish in time - cancelled it")
                 self.auto_task = None
             
             logger.info("Auto mode stopped")
@@ -258,7 +418,7 @@ class SimpleSupervisorAgent:
             }
             
         except Exception as e:
-            logger.error(f"Failed to stop auto mode: {e}")
+            logger.error("Failed to stop auto mode: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -273,10 +433,24 @@ class SimpleSupervisorAgent:
             Dict with system status information
         """
         try:
-            # Test scraper connection
-            scraper_healthy = False
+            # Probe the scraper and database concurrently; a probe that has not answered
+            # within HEALTH_CHECK_TIMEOUT is cancelled and reported as timed out
+            probes = {'database': asyncio.ensure_future(self.database.health_check())}
             if self.scraper_agent:
-                scraper_healthy = await self.scraper_agent.test_connection()
+                probes['scraper'] = asyncio.ensure_future(self.scraper_agent.test_connection())
+            done, pending = await asyncio.wait(probes.values(), timeout=HEALTH_CHECK_TIMEOUT)
+            for task in pending:
+                task.cancel()
+            # Let the cancelled probes finish unwinding, so none is left pending or
+            # with an exception nobody retrieved
+            await asyncio.gather(*pending, return_exceptions=True)
+            health = {}
+            for name, task in probes.items():
+                if task in pending:
+                    health[name] = None
+                else:
+                    health[name] = task.exception() is None and bool(task.result())
+            scraper_healthy = bool(health.get('scraper'))
             
             status = {
                 'supervisor_agent': {
@@ -286,10 +460,14 @@ class SimpleSupervisorAgent:
                     'cached_searches': len(self.search_results_cache)
                 },
                 'scraper_agent': {
-                    'status': 'running' if scraper_healthy else 'error',
+                    'status': _probe_status(health.get('scraper', False)),
                     'healthy': scraper_healthy,
                     'type': 'simple_http_scraper'
                 },
+                'database': {
+                    'status': _probe_status(health['database']),
+                    'healthy': bool(health['database'])
+                },
                 'system': {
                     'timestamp': datetime.now().isoformat(),
                     'uptime_info': 'Available',
@@ -300,7 +478,7 @@ class SimpleSupervisorAgent:
             return status
             
         except Exception as e:
-            logger.error(f"Failed to get system status: {e}")
+            logger.error("Failed to get system status: %s", e)
             return {
                 'error': str(e),
                 'timestamp': datetime.now().isoformat()
@@ -320,38 +498,58 @@ class SimpleSupervisorAgent:
                 result = await self.trigger_job_search(search_params)
                 
                 if result.get('success'):
-                    logger.info(f"Auto search found {result.get('total_found', 0)} jobs")
+                    logger.info("Auto search found %s jobs", result.get('total_found', 0))
                 else:
-                    logger.error(f"Auto search failed: {result.get('error', 'Unknown error')}")
+                    logger.error("Auto search failed: %s", result.get('error', 'Unknown error'))
                 
-                # Wait for next search
-                await asyncio.sleep(search_interval)
+                # Wait for next search, waking as soon as auto mode is stopped
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=search_interval)
+                    break
+                except asyncio.TimeoutError:
+                    pass
                 
         except asyncio.CancelledError:
             logger.info("Auto search loop cancelled")
         except Exception as e:
-            logger.error(f"Auto search loop error: {e}")
+            logger.error("Auto search loop error: %s", e)
             self.is_auto_mode = False
     
-    def _create_cache_key(self, search_params: Dict) -> str:
-        """Create a cache key from search parameters"""
-        # Create a normalized key from search params
-        key_parts = [
-            search_params.get('keywords', '').lower().strip(),
-            search_params.get('location', '').lower().strip(),
-            str(search_params.get('max_results', 50))
-        ]
-        return '|'.join(key_parts)
+    def _create_cache_key(self, search_params: Dict, user_id: Optional[int] = None) -> str:
+        """Create a cache key from search parameters and the user searching"""
+        return _norm_key(
+            search_params.get('keywords', ''),
+            search_params.get('location', ''),
+            str(search_params.get('max_results', 50)),
+            user_id
+        )
+    
+    def _cache_result(self, cache_key: str, result: Dict, user_id: Optional[int] = None):
+        """Cache a search result, evicting the user's own oldest search when they are over their share"""
+        if cache_key in self.search_results_cache:
+            self._cache_entries_per_user[self.search_results_cache.pop(cache_key)[2]] -= 1
+        self.search_results_cache[cache_key] = (
+            _freeze_result(result), time.monotonic() + self.max_cache_age.total_seconds(), user_id
+        )
+        self._cache_entries_per_user[user_id] += 1
+        
+        if self._cache_entries_per_user[user_id] > SEARCH_CACHE_SIZE_PER_USER:
+            # One busy user only ever pushes out their own results: expired ones
+            # first, as the cache lives as long as the app, else the least recently used
+            user_keys = [key for key, entry in self.search_results_cache.items() if entry[2] == user_id]
+            now = time.monotonic()
+            expired_keys = [key for key in user_keys if self.search_results_cache[key][1] <= now]
+            for key in expired_keys or user_keys[:1]:
+                del self.search_results_cache[key]
+                self._cache_entries_per_user[user_id] -= 1
+        elif len(self.search_results_cache) > SEARCH_CACHE_SIZE:
+            _, (_, _, evicted_user) = self.search_results_cache.popitem(last=False)
+            self._cache_entries_per_user[evicted_user] -= 1
     
     def _is_cache_valid(self, cache_key: str) -> bool:
         """Check if cached results are still valid"""
-        if cache_key not in self.search_results_cache:
-            return False
-        
-        cached_result = self.search_results_cache[cache_key]
-        cached_time = datetime.fromisoformat(cached_result['timestamp'])
-        
-        return datetime.now() - cached_time < self.max_cache_age
+        entry = self.search_results_cache.get(cache_key)
+        return entry is not None and time.monotonic() < entry[1]
     
     def is_healthy(self) -> bool:
         """Check if the supervisor agent is healthy"""
@@ -363,7 +561,7 @@ class SimpleSupervisorAgent:
     async def apply_to_job(self, user_id: int, job_id: int) -> Dict:
         """Apply to a specific job manually"""
         try:
-            logger.info(f"Manual apply triggered for user {user_id}, job {job_id}")
+            logger.info("Manual apply triggered for user %s, job %s", user_id, job_id)
             
             # Apply using auto-apply agent
             results = await self.autoapply_agent.auto_apply_to_jobs(user_id, [job_id])
@@ -389,7 +587,7 @@ class SimpleSupervisorAgent:
                 }
                 
         except Exception as e:
-            logger.error(f"Error in manual apply for job {job_id}: {e}")
+            logger.error("Error in manual apply for job %s: %s", job_id, e)
             return {
                 'success': False,
                 'job_id': job_id,
@@ -406,7 +604,7 @@ class SimpleSupervisorAgent:
             self.auto_apply_threshold = threshold
             self.max_auto_applies_per_day = max_per_day
             
-            logger.info(f"Auto-apply enabled for user {user_id} with threshold {threshold}")
+            logger.info("Auto-apply enabled for user %s with threshold %s", user_id, threshold)
             
             return {
                 'success': True,
@@ -418,7 +616,7 @@ class SimpleSupervisorAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error enabling auto-apply: {e}")
+            logger.error("Error enabling auto-apply: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -436,14 +634,14 @@ class SimpleSupervisorAgent:
             if 'max_per_day' in config:
                 self.max_auto_applies_per_day = config['max_per_day']
             
-            logger.info(f"Auto-apply configured: enabled={self.auto_apply_enabled}, threshold={self.auto_apply_threshold}")
+            logger.info("Auto-apply configured: enabled=%s, threshold=%s", self.auto_apply_enabled, self.auto_apply_threshold)
             return {
                 'success': True,
                 'message': 'Auto-apply configuration updated',
                 'timestamp': datetime.now().isoformat()
             }
         except Exception as e:
-            logger.error(f"Error configuring auto-apply: {e}")
+            logger.error("Error configuring auto-apply: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -464,7 +662,7 @@ class SimpleSupervisorAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error disabling auto-apply: {e}")
+            logger.error("Error disabling auto-apply: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -486,10 +684,19 @@ class SimpleSupervisorAgent:
             # This would typically get scored jobs above threshold
             # For now, we'll implement a basic version
             
-            logger.info(f"Checking for auto-apply opportunities for user {user_id}")
+            if not self._can_auto_apply():
+                return {
+                    'success': False,
+                    'message': f'Daily auto-apply limit of {self.max_auto_applies_per_day} reached',
+                    'user_id': user_id,
+                    'timestamp': datetime.now().isoformat()
+                }
+            
+            logger.info("Checking for auto-apply opportunities for user %s", user_id)
             
             # Get recent jobs that haven't been applied to
-            # Score them and apply to high-scoring ones
+            # Score them and apply to high-scoring ones, recording each with _record_auto_apply
+            # while _can_auto_apply allows
             # This is a simplified implementation
             
             return {
@@ -503,7 +710,7 @@ class SimpleSupervisorAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error in auto-apply check: {e}")
+            logger.error("Error in auto-apply check: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -511,6 +718,18 @@ class SimpleSupervisorAgent:
                 'timestamp': datetime.now().isoformat()
             }
     
+    def _can_auto_apply(self) -> bool:
+        """Whether another auto-application fits in the last 24 hours' limit"""
+        # Times are appended in order, so expired ones are always at the left end
+        cutoff = time.monotonic() - AUTO_APPLY_WINDOW
+        while self._auto_apply_times and self._auto_apply_times[0] < cutoff:
+            self._auto_apply_times.popleft()
+        return len(self._auto_apply_times) < self.max_auto_applies_per_day
+    
+    def _record_auto_apply(self):
+        """Count an auto-application against the daily limit"""
+        self._auto_apply_times.append(time.monotonic())
+    
     def get_auto_apply_status(self) -> Dict:
         """Get current auto-apply settings and status"""
         return {
@@ -395,7 +395,7 @@ class SupervisorAgent:
                 user_id, job_ids_to_apply
             )
             
-            successful_applications = len([r for r in application_results if r['success']])
+            successful_applications = sum(1 for r in application_results if r['success'])
             
             result = {
                 'success': True,
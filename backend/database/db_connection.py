@@ -6,15 +6,50 @@ SQLite database setup with SQLAlchemy ORM
 import os
 import logging
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Set
 from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import select, insert, func, bindparam, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, relationship
 from sqlalchemy.pool import StaticPool
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _json_default(value):
+    """What json.dumps(default=str) makes of values orjson does not encode itself"""
+    # Float subclasses such as numpy.float64 are numbers to json, not strings
+    if isinstance(value, float):
+        return float(value)
+    return str(value)
+
+
+# orjson options that keep its output the same as json.dumps(value, default=str): int, float,
+# bool and None keys become strings, and datetimes and dataclasses go to str() via the default
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if ORJSON_AVAILABLE else 0
+)
+
+
+def dumps_json(value) -> str:
+    """Serialize a value for a JSON text column, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, default=_json_default, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which only json encodes
+            pass
+    return json.dumps(value, default=str)
+
 # Database URL from environment
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./skillnavigator.db")
 
@@ -59,7 +94,7 @@ class User(Base):
     
     def set_skills(self, skills: List[str]):
         """Set skills from list"""
-        self.skills = json.dumps(skills)
+        self.skills = dumps_json(skills)
     
     def get_preferences(self) -> dict:
         """Get preferences as dict"""
@@ -69,7 +104,7 @@ class User(Base):
     
     def set_preferences(self, preferences: dict):
         """Set preferences from dict"""
-        self.preferences = json.dumps(preferences)
+        self.preferences = dumps_json(preferences)
 
 
 class Job(Base):
@@ -108,7 +143,7 @@ class Job(Base):
     
     def set_skills_match(self, skills_match: dict):
         """Set skills match from dict"""
-        self.skills_match = json.dumps(skills_match)
+        self.skills_match = dumps_json(skills_match)
 
 
 class JobApplication(Base):
@@ -174,7 +209,21 @@ class SystemLog(Base):
     
     def set_metadata(self, metadata: dict):
         """Set metadata from dict"""
-        self.metadata_json = json.dumps(metadata)
+        self.metadata_json = dumps_json(metadata)
+
+
+# Statements built once and reused, so every call hits SQLAlchemy's compiled-statement cache
+EXISTING_APPLICATIONS_STMT = select(JobApplication.job_id).where(
+    JobApplication.user_id == bindparam("user_id"),
+    JobApplication.job_id.in_(bindparam("job_ids", expanding=True))
+)
+EXISTING_JOB_IDS_STMT = select(Job.external_id).where(
+    Job.external_id.in_(bindparam("external_ids", expanding=True))
+)
+AUTO_APPLICATIONS_SINCE_STMT = select(func.count(JobApplication.id)).where(
+    JobApplication.auto_applied.is_(True),
+    JobApplication.applied_at >= bindparam("since")
+)
 
 
 class Database:
@@ -238,7 +287,7 @@ class Database:
         try:
             db = self.get_session()
             # Simple query to test connection
-            db.execute("SELECT 1")
+            db.execute(text("SELECT 1"))
             db.close()
             return True
         except Exception as e:
@@ -277,27 +326,33 @@ class Database:
             db.close()
     
     async def save_jobs(self, jobs: List[dict]) -> List[Job]:
-        """Save scraped jobs to database"""
+        """Save scraped jobs to database, skipping ones already stored"""
+        if not jobs:
+            return []
         db = self.get_session()
         saved_jobs = []
         
         try:
-            for job_data in jobs:
-                # Check if job already exists
-                existing_job = db.query(Job).filter(
-                    Job.external_id == job_data.get("external_id")
-                ).first()
-                
-                if not existing_job:
-                    job = Job(**job_data)
-                    db.add(job)
-                    saved_jobs.append(job)
+            # One query finds every job that already exists; repeats within the batch are skipped too
+            external_ids = [job_data.get("external_id") for job_data in jobs]
+            known_ids = set(db.execute(
+                EXISTING_JOB_IDS_STMT, {"external_ids": [i for i in external_ids if i is not None]}
+            ).scalars())
             
-            db.commit()
+            new_jobs = []
+            for job_data, external_id in zip(jobs, external_ids):
+                if external_id in known_ids:
+                    continue
+                if external_id is not None:
+                    known_ids.add(external_id)
+                new_jobs.append(job_data)
             
-            # Refresh all saved jobs
-            for job in saved_jobs:
-                db.refresh(job)
+            if new_jobs:
+                # A single multi-row INSERT ... RETURNING hands back the saved jobs, so
+                # none has to be re-read after the commit
+                saved_jobs = list(db.scalars(insert(Job).returning(Job), new_jobs))
+                db.expire_on_commit = False
+                db.commit()
             
             return saved_jobs
         except Exception as e:
@@ -325,6 +380,51 @@ class Database:
         finally:
             db.close()
     
+    async def get_jobs_by_ids(self, job_ids: List[int]) -> Dict[int, Job]:
+        """Get several jobs by ID in a single query"""
+        if not job_ids:
+            return {}
+        db = self.get_session()
+        try:
+            jobs = db.query(Job).filter(Job.id.in_(job_ids)).all()
+            return {job.id: job for job in jobs}
+        finally:
+            db.close()
+    
+    async def get_existing_applications(self, user_id: int, job_ids: List[int]) -> Set[int]:
+        """Get the IDs of the given jobs the user has already applied to"""
+        if not job_ids:
+            return set()
+        db = self.get_session()
+        try:
+            rows = db.execute(EXISTING_APPLICATIONS_STMT, {"user_id": user_id, "job_ids": list(job_ids)})
+            return set(rows.scalars())
+        finally:
+            db.close()
+    
+    async def count_auto_applications_since(self, since: datetime) -> int:
+        """Count automatic applications made at or after the given time"""
+        db = self.get_session()
+        try:
+            return db.execute(AUTO_APPLICATIONS_SINCE_STMT, {"since": since}).scalar_one()
+        finally:
+            db.close()
+    
+    async def save_applications(self, applications: List[dict]):
+        """Save job applications in a single batch"""
+        if not applications:
+            return
+        db = self.get_session()
+        try:
+            db.bulk_insert_mappings(JobApplication, applications)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to save applications: {e}")
+            raise e
+        finally:
+            db.close()
+    
     async def update_job_scores(self, job_scores: List[dict]):
         """Update job relevance scores"""
         db = self.get_session()
@@ -12,12 +12,13 @@ import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from dotenv import load_dotenv
 
 from database.db_connection import Database
 from routes import jobs, user, tracker
 from agents.simple_supervisor_agent import SimpleSupervisorAgent
+from agents.simple_scraper_agent import shutdown_parse_pool
 
 # Load environment variables
 load_dotenv()
@@ -55,6 +56,8 @@ async def lifespan(app: FastAPI):
     try:
         supervisor_agent = SimpleSupervisorAgent()
         await supervisor_agent.initialize()
+        # The API routes share this supervisor rather than starting their own
+        jobs.set_supervisor(supervisor_agent)
         logger.info("Simple supervisor agent initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize supervisor agent: {e}")
@@ -64,8 +67,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down SkillNavigator backend...")
+    jobs.set_supervisor(None)
     if supervisor_agent:
         await supervisor_agent.cleanup()
+    shutdown_parse_pool()
 
 
 # Create FastAPI application
@@ -170,8 +175,10 @@ async def trigger_job_search(search_params: dict):
         raise HTTPException(status_code=503, detail="Supervisor agent not initialized")
     
     try:
-        result = await supervisor_agent.trigger_job_search(search_params)
-        return result
+        # Encoded by the supervisor (orjson when installed) and sent as-is
+        user_id = search_params.pop('user_id', None)
+        payload = await supervisor_agent.trigger_job_search_json(search_params, user_id)
+        return Response(content=payload, media_type="application/json")
     except Exception as e:
         logger.error(f"Failed to trigger job search: {e}")
         raise HTTPException(status_code=500, detail="Failed to trigger job search")
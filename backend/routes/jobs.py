@@ -23,6 +23,7 @@ class JobSearchRequest(BaseModel):
     max_jobs: Optional[int] = 50
     salary_min: Optional[float] = None
     salary_max: Optional[float] = None
+    user_id: Optional[int] = None
 
 class JobResponse(BaseModel):
     id: int
@@ -51,13 +52,28 @@ class BulkApplyRequest(BaseModel):
     job_ids: List[int]
     user_id: int = 1  # Default user for demo
 
+# Supervisor agent shared by every request; the main app provides its own on startup
+_supervisor: Optional[SimpleSupervisorAgent] = None
+
+
+def set_supervisor(supervisor: Optional[SimpleSupervisorAgent]):
+    """Use the app's supervisor agent for these routes"""
+    global _supervisor
+    _supervisor = supervisor
+
+
 # Dependency to get supervisor agent
 async def get_supervisor() -> SimpleSupervisorAgent:
-    # This would be injected from the main app
-    # For now, create a new instance (not ideal for production)
-    supervisor = SimpleSupervisorAgent()
-    await supervisor.initialize()
-    return supervisor
+    global _supervisor
+    if _supervisor is None:
+        # Not started by the main app: create one and keep it for later requests
+        supervisor = SimpleSupervisorAgent()
+        await supervisor.initialize()
+        if _supervisor is None:
+            _supervisor = supervisor
+        else:
+            await supervisor.cleanup()
+    return _supervisor
 
 
 @router.get("/", response_model=List[JobResponse])
@@ -114,9 +130,10 @@ async def search_jobs(
     try:
         # Convert request to search parameters
         search_params = search_request.dict(exclude_none=True)
+        user_id = search_params.pop('user_id', None)
         
         # Trigger job search workflow
-        result = await supervisor.trigger_job_search(search_params)
+        result = await supervisor.trigger_job_search(search_params, user_id)
         
         if not result['success']:
             raise HTTPException(status_code=500, detail=result.get('error', 'Job search failed'))
@@ -212,8 +229,8 @@ async def apply_to_jobs(
             apply_request.user_id, apply_request.job_ids
         )
         
-        successful_applications = len([r for r in application_results if r['success']])
-        failed_applications = len([r for r in application_results if not r['success']])
+        successful_applications = sum(1 for r in application_results if r['success'])
+        failed_applications = len(application_results) - successful_applications
         
         return {
             "message": "Bulk application completed",
@@ -0,0 +1,10 @@
+"""
+Test setup: import the backend packages the way the app does, against a throwaway database
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "test.db"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
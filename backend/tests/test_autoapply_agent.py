@@ -0,0 +1,35 @@
+"""
+Tests for how the auto-apply agent routes a job to an application method
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from agents.autoapply_agent import AutoApplyAgent
+
+
+def route(source, apply_url, browser=None):
+    agent = AutoApplyAgent()
+    agent.browser = browser
+    return agent._determine_application_method(SimpleNamespace(source=source, apply_url=apply_url))
+
+
+@pytest.mark.parametrize("source, apply_url, method", [
+    ('linkedin', 'mailto:jobs@acme.test', 'linkedin'),
+    ('remoteok', 'https://www.linkedin.com/jobs/view/1', 'form'),
+    ('remoteok', 'mailto:jobs@acme.test', 'email'),
+    ('remoteok', '', 'manual'),
+])
+def test_browser_routing_prefers_the_job_source(source, apply_url, method):
+    assert route(source, apply_url) == method
+
+
+@pytest.mark.parametrize("apply_url, method", [
+    ('https://www.linkedin.com:443/jobs/view/1', 'http_linkedin'),
+    ('https://in.indeed.com/viewjob?jk=1', 'http_indeed'),
+    ('https://acme.test/apply?ref=linkedin.com', 'http_form'),
+    ('mailto:jobs@acme.test', 'email'),
+])
+def test_http_session_routing_matches_the_apply_host(apply_url, method):
+    assert route('remoteok', apply_url, browser="http_session") == method
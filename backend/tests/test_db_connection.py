@@ -0,0 +1,37 @@
+"""
+Tests for encoding the database's JSON text columns
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from database.db_connection import dumps_json
+
+
+def assert_matches_json(value):
+    assert json.loads(dumps_json(value)) == json.loads(json.dumps(value, default=str))
+
+
+@pytest.mark.parametrize("value", [
+    ["Python", "JavaScript", "React"],
+    {"phone": "+1 555 0100", "job_types": ["full-time", "remote"], "salary_min": 50000.0},
+    {"user_id": 1, "total_applications": 12, "status_breakdown": {"applied": 10, "interview": 2}},
+    {"keywords": "python developer", "location": "Remote", "max_results": 50},
+    {"started_at": datetime(2024, 1, 2, 3, 4, 5), "tags": {"python", "go"}},
+    {1: "first", 2.5: "second", None: "none"},
+    {"external_id": 2 ** 70},
+])
+def test_dumps_json_matches_stdlib_json(value):
+    assert_matches_json(value)
+
+
+def test_dumps_json_encodes_numpy_scores_like_stdlib_json():
+    np = pytest.importorskip("numpy")
+    assert_matches_json({
+        "matched_skills": ["python"],
+        "similarity": np.float64(0.83),
+        "weight": np.float32(0.5),
+        "matched_count": np.int64(3),
+    })
@@ -0,0 +1,42 @@
+"""
+Tests for the simple scraper agent's duplicate filtering
+"""
+
+import pytest
+
+from agents.simple_scraper_agent import JobListing, _JobDeduplicator
+
+DESCRIPTION = (
+    "Join our payments infrastructure team to design, build and operate the services "
+    "behind card processing, with a strong focus on reliability and observability."
+)
+
+
+def test_distinct_roles_with_fallback_descriptions_are_kept():
+    jobs = [
+        JobListing(title=title, company="Stripe", location="Remote", url="https://stripe.com/jobs",
+                   description=f"Position at Stripe: {title}")
+        for title in ("Senior Backend Engineer (Python)", "Senior Backend Engineer (Go)")
+    ]
+    
+    assert _JobDeduplicator().filter(jobs) == jobs
+
+
+def test_distinct_roles_sharing_a_description_are_kept():
+    jobs = [
+        JobListing(title=title, company="Stripe", location="Remote", url="https://stripe.com/jobs",
+                   description=DESCRIPTION)
+        for title in ("Senior Backend Engineer (Python)", "Senior Backend Engineer (Go)")
+    ]
+    
+    assert _JobDeduplicator().filter(jobs) == jobs
+
+
+def test_reposted_job_is_dropped():
+    pytest.importorskip("datasketch")
+    original = JobListing(title="Senior Backend Engineer", company="Stripe", location="Remote",
+                          url="https://stripe.com/jobs/1", description=DESCRIPTION)
+    repost = JobListing(title="Senior Backend Engineer", company="Stripe, Inc.", location="Remote",
+                        url="https://example.com/stripe", description=DESCRIPTION + " Apply now.")
+    
+    assert _JobDeduplicator().filter([original, repost]) == [original]
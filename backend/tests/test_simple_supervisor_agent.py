@@ -0,0 +1,97 @@
+"""
+Tests for the simple supervisor agent's auto-apply limit and search cache
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from agents.simple_scraper_agent import JobListing
+from agents import simple_supervisor_agent as supervisor_module
+from agents.simple_supervisor_agent import SimpleSupervisorAgent
+
+
+class FakeDatabase:
+    """Accepts every job it is asked to save"""
+    
+    async def save_jobs(self, jobs):
+        return list(jobs)
+
+
+class FakeScraper:
+    """Streams two fixed jobs and counts the searches it runs"""
+    
+    def __init__(self):
+        self.searches = 0
+    
+    async def iter_jobs(self, search_params):
+        self.searches += 1
+        for title in ("Backend Engineer", "Data Engineer"):
+            yield JobListing(title=title, company="Acme", location="Remote", url="https://acme.test/jobs",
+                             description=f"Position at Acme: {title}", skills=["python"])
+
+
+def make_supervisor(max_per_day=3):
+    supervisor = SimpleSupervisorAgent()
+    supervisor.scraper_agent = FakeScraper()
+    supervisor.database = FakeDatabase()
+    supervisor.auto_apply_enabled = True
+    supervisor.max_auto_applies_per_day = max_per_day
+    return supervisor
+
+
+def test_auto_apply_check_stops_at_daily_limit():
+    async def run():
+        supervisor = make_supervisor(max_per_day=2)
+        
+        assert (await supervisor.check_and_auto_apply(user_id=1))['success']
+        supervisor._record_auto_apply()
+        supervisor._record_auto_apply()
+        
+        result = await supervisor.check_and_auto_apply(user_id=1)
+        assert not result['success']
+        assert 'limit' in result['message']
+    
+    asyncio.run(run())
+
+
+def test_auto_applications_expire_after_a_day(monkeypatch):
+    supervisor = make_supervisor(max_per_day=2)
+    now = 1000.0
+    monkeypatch.setattr(supervisor_module.time, 'monotonic', lambda: now)
+    
+    supervisor._record_auto_apply()
+    now += 60
+    supervisor._record_auto_apply()
+    assert not supervisor._can_auto_apply()
+    
+    now += supervisor_module.AUTO_APPLY_WINDOW - 30
+    assert supervisor._can_auto_apply()
+    assert len(supervisor._auto_apply_times) == 1
+
+
+def test_mutating_a_result_leaves_the_cache_unchanged():
+    async def run():
+        supervisor = make_supervisor()
+        params = {'keywords': 'engineer', 'location': 'Remote'}
+        
+        first = await supervisor.trigger_job_search(dict(params))
+        expected = [dict(job, skills=list(job['skills'])) for job in first['jobs']]
+        first['jobs'][0]['title'] = 'Changed'
+        first['jobs'][0]['skills'].append('cobol')
+        first['jobs'].append({'title': 'Extra'})
+        
+        hit = await supervisor.trigger_job_search(dict(params))
+        assert [dict(job, skills=list(job['skills'])) for job in hit['jobs']] == expected
+        with pytest.raises(TypeError):
+            hit['jobs'][0]['title'] = 'Changed'
+        hit['search_params']['keywords'] = 'changed'
+        
+        again = await supervisor.trigger_job_search(dict(params))
+        assert again['jobs'] is hit['jobs']
+        assert again['search_params']['keywords'] == 'engineer'
+        assert json.loads(await supervisor.trigger_job_search_json(dict(params)))['jobs'] == expected
+        assert supervisor.scraper_agent.searches == 1
+    
+    asyncio.run(run())
@@ -4,8 +4,9 @@ Cover letter generation and other AI-powered text generation
 """
 
 import os
+import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import openai
 
 logger = logging.getLogger(__name__)
@@ -58,6 +59,31 @@ class CoverLetterGenerator:
             logger.error(f"Error generating cover letter: {e}")
             return self._generate_fallback_cover_letter(user_profile, job)
     
+    async def generate_batch(self, user_profile: Dict, jobs: List, template_type: str = 'default',
+                             max_concurrency: int = 5) -> List[str]:
+        """
+        Generate cover letters for several jobs at once
+        
+        Requests share the generator's single OpenAI client (and its connection
+        pool) and run concurrently, at most max_concurrency at a time.
+        
+        Args:
+            user_profile: User profile dictionary
+            jobs: Job objects or dictionaries
+            template_type: Type of template to use
+            max_concurrency: Maximum number of generations in flight
+            
+        Returns:
+            Generated cover letters, in the same order as jobs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate(job) -> str:
+            async with semaphore:
+                return await self.generate_cover_letter(user_profile, job, template_type)
+        
+        return list(await asyncio.gather(*(generate(job) for job in jobs)))
+    
     async def _generate_ai_cover_letter(self, user_profile: Dict, job) -> str:
         """Generate cover letter using OpenAI"""
         
@@ -6,19 +6,28 @@ Common functions for web scraping across different job portals
 import re
 import random
 import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import Tuple, Optional
 import string
 
 
+# Patterns compiled once; clean_text and extract_salary run for every scraped field
+_WHITESPACE_RE = re.compile(r'\s+')
+_DISALLOWED_CHARS_RE = re.compile(r'[^\w\s\-\.,()&]')
+_SALARY_CHARS_RE = re.compile(r'[^\d\s\-\.]')
+_SALARY_RANGE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*[-–]\s*(\d+(?:\.\d+)?)')
+_SALARY_SINGLE_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+
 def clean_text(text: str) -> str:
     """Clean and normalize scraped text"""
     if not text:
         return ""
     
     # Remove extra whitespace and special characters
-    text = re.sub(r'\s+', ' ', text.strip())
-    text = re.sub(r'[^\w\s\-\.,()&]', '', text)
+    text = _WHITESPACE_RE.sub(' ', text.strip())
+    text = _DISALLOWED_CHARS_RE.sub('', text)
     
     return text
 
@@ -37,43 +46,29 @@ def extract_salary(salary_text: str) -> Tuple[Optional[float], Optional[float]]:
     
     # Remove currency symbols and normalize
     text = salary_text.replace(',', '').replace('₹', '').replace('$', '')
-    text = re.sub(r'[^\d\s\-\.]', '', text)
+    text = _SALARY_CHARS_RE.sub('', text)
     
-    # Pattern for salary ranges
-    range_pattern = r'(\d+(?:\.\d+)?)\s*[-–]\s*(\d+(?:\.\d+)?)'
-    range_match = re.search(range_pattern, text)
+    # K notation (thousands) and L notation (lakhs - Indian currency)
+    lowered = salary_text.lower()
+    thousands = 'k' in lowered or 'thousand' in lowered
+    lakhs = 'l' in lowered or 'lakh' in lowered
+    
+    def scale(value: float) -> float:
+        if thousands:
+            value *= 1000
+        if lakhs:
+            value *= 100000
+        return value
     
+    # Pattern for salary ranges
+    range_match = _SALARY_RANGE_RE.search(text)
     if range_match:
-        min_sal = float(range_match.group(1))
-        max_sal = float(range_match.group(2))
-        
-        # Handle K notation (thousands)
-        if 'k' in salary_text.lower() or 'thousand' in salary_text.lower():
-            min_sal *= 1000
-            max_sal *= 1000
-        
-        # Handle L notation (lakhs - Indian currency)
-        if 'l' in salary_text.lower() or 'lakh' in salary_text.lower():
-            min_sal *= 100000
-            max_sal *= 100000
-        
-        return min_sal, max_sal
+        return scale(float(range_match.group(1))), scale(float(range_match.group(2)))
     
     # Pattern for single salary value
-    single_pattern = r'(\d+(?:\.\d+)?)'
-    single_match = re.search(single_pattern, text)
-    
+    single_match = _SALARY_SINGLE_RE.search(text)
     if single_match:
-        salary = float(single_match.group(1))
-        
-        # Handle K notation
-        if 'k' in salary_text.lower() or 'thousand' in salary_text.lower():
-            salary *= 1000
-        
-        # Handle L notation
-        if 'l' in salary_text.lower() or 'lakh' in salary_text.lower():
-            salary *= 100000
-        
+        salary = scale(float(single_match.group(1)))
         return salary, salary
     
     return None, None
@@ -153,6 +148,29 @@ async def wait_random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0):
     await asyncio.sleep(delay)
 
 
+class TokenBucket:
+    """Async token bucket allowing `rate` acquisitions per second, in bursts of up to `capacity`"""
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it; waiters are served in order"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
 def extract_job_type(text: str) -> str:
     """Extract job type from job text"""
     if not text: